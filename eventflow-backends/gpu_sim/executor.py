@@ -18,9 +18,11 @@ from typing import Any, Dict, List, Tuple
 SCHEMA_VERSION = "0.1.0"
 
 
-def _canonical_key(rec: Tuple[int, List[int], float]) -> tuple:
-    ts, idx, _ = rec
-    return (ts, tuple(idx or []))
+def _canonical_key(rec: Tuple[int, List[int], float]) -> int:
+    # Sort on ts alone. list.sort is stable, so ties keep JSONL read order,
+    # which is already deterministic for a fixed input set; keying on
+    # tuple(idx) as well only added a tuple allocation per compare.
+    return rec[0]
 
 
 def _write_header(fh, dims: List[str], units_value: str, meta: Dict[str, Any]) -> None:
@@ -22,6 +22,14 @@ class EIRGraph:
     def add_node(self, nid: str, op: OpDef): self.nodes[nid] = Node(op, nid)
     def connect(self, src: str, sport: str, dst: str, dport: str): self.edges.append(Edge((src, sport), (dst, dport)))
 
+    def __deepcopy__(self, memo: dict) -> "EIRGraph":
+        # Ops are never mutated after construction, so only the graph shell
+        # (node/edge/metadata containers) needs duplicating; nodes and ops are
+        # shared by reference instead of walked by copy.deepcopy's default.
+        new = EIRGraph(nodes=dict(self.nodes), edges=list(self.edges), metadata=dict(self.metadata))
+        memo[id(self)] = new
+        return new
+
     def topo(self) -> List[str]:
         indeg = {nid: 0 for nid in self.nodes}; adj = {nid: [] for nid in self.nodes}
         for e in self.edges: indeg[e.dst[0]] += 1; adj[e.src[0]].append(e.dst[0])
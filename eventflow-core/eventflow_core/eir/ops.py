@@ -2,6 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterator, Tuple, Optional
 from .types import OpDef, Port, time_to_ns
+import functools
 import math
 
 Event = Tuple[int, int, float, dict]
@@ -72,19 +73,35 @@ class MelBands:
     def as_op(self) -> OpDef:
         return OpDef("mel", self.name, [Port("in")], [Port("mel")], self.__dict__)
 
-def _hann_window(N: int) -> list[float]:
+@functools.lru_cache(maxsize=8)
+def _hann_window(N: int) -> tuple[float, ...]:
+    # Cached per size (tuple, so cache entries stay immutable); step_stft
+    # rebuilds its window on every call otherwise.
     if N <= 1:
-        return [1.0] * max(N, 1)
-    return [0.5 - 0.5 * math.cos(2.0 * math.pi * n / (N - 1)) for n in range(N)]
+        return (1.0,) * max(N, 1)
+    return tuple(0.5 - 0.5 * math.cos(2.0 * math.pi * n / (N - 1)) for n in range(N))
 
 def _round_div(a: int, b: int) -> int:
     return int(round(a / b))
 
+@functools.lru_cache(maxsize=8)
+def _dft_tables(N: int) -> tuple[list[list[float]], list[list[float]]]:
+    # Cosine/sine twiddle tables for an N-point real DFT (bins 0..N//2).
+    # Cached per frame size so the inner DFT loop is pure multiply-adds
+    # instead of recomputing cos/sin for every (k, n) of every frame.
+    cos_t: list[list[float]] = []
+    sin_t: list[list[float]] = []
+    for k in range(N // 2 + 1):
+        ang_base = 2.0 * math.pi * k / N
+        cos_t.append([math.cos(ang_base * n) for n in range(N)])
+        sin_t.append([math.sin(ang_base * n) for n in range(N)])
+    return cos_t, sin_t
+
 def step_stft(inputs: Iterator[Event], n_fft: int, hop_ns: int, sample_rate_hz: int, window: str) -> Iterator[Event]:
     # Deterministic software STFT for PCM sample events on ch=0. Missing samples treated as zeros.
     sr = float(sample_rate_hz)
     hop_samples = max(1, int(round(hop_ns * sr / 1e9)))
-    w = _hann_window(n_fft) if window == "hann" else [1.0] * n_fft
+    w = _hann_window(n_fft) if window == "hann" else (1.0,) * n_fft
     next_start = 0
     samples: dict[int, float] = {}
     last_idx = -1
@@ -96,17 +113,16 @@ def step_stft(inputs: Iterator[Event], n_fft: int, hop_ns: int, sample_rate_hz:
         frame = [samples.get(start_idx + n, 0.0) * w[n] for n in range(N)]
         half = N // 2
         t_frame_ns = int(round((start_idx + N) * 1e9 / sr))
+        cos_t, sin_t = _dft_tables(N)
         for k in range(0, half + 1):
             re = 0.0
             im = 0.0
-            ang_base = 2.0 * math.pi * k / N
+            ck = cos_t[k]
+            sk = sin_t[k]
             for n in range(N):
-                ang = ang_base * n
-                c = math.cos(ang)
-                s = math.sin(ang)
                 x = frame[n]
-                re += x * c
-                im -= x * s
+                re += x * ck[n]
+                im -= x * sk[n]
             mag = math.sqrt(re * re + im * im)
             yield (t_frame_ns, k, mag, {"unit": "mag", "n_fft": N})
 
@@ -200,6 +216,61 @@ class ShiftXY:
     def as_op(self) -> OpDef:
         return OpDef("shift_xy", self.name, [Port("in")], [Port("out")], self.__dict__)
 
+@dataclass
+class FusedOFlowEW:
+    """Kernel-fused east/west coincidence flow: shift(+-x) + delay + fuse in one op.
+
+    Consumes channel events (as produced by XYToChannel) and emits coincidence
+    events tagged with meta["dir"] of "east" or "west", equivalent to wiring
+    ShiftXY -> DelayLine -> EventFuse per direction but with a single state
+    machine and no per-node dispatch.
+    """
+    name: str
+    window: str = "2 ms"
+    delay: str = "1 ms"
+    min_count: int = 2
+    width: int = 128
+    height: int = 128
+    def as_op(self) -> OpDef:
+        return OpDef("oflow_ew", self.name, [Port("in")], [Port("east"), Port("west")], self.__dict__)
+
+def step_oflow_ew(inputs: Iterator[Event], window_ns: int, delay_ns: int, min_count: int, width: int, height: int) -> Iterator[Event]:
+    events = list(inputs)
+    max_x = width - 1
+    max_y = height - 1
+    fires: list[Event] = []
+    for direction, dx in (("east", 1), ("west", -1)):
+        # B stream: shifted by dx with edge clamping (as ShiftXY), then delayed
+        b_ts = []
+        for t, ch, _val, _meta in events:
+            if ch < 0:
+                continue
+            x = ch % width
+            y = ch // width
+            if 0 <= x <= max_x and 0 <= y <= max_y:
+                b_ts.append(t + delay_ns)
+        b_ts.sort()
+        a_ts = sorted(t for t, _, _, _ in events)
+        # Coincidence between A and B within [t - window, t], A first at ties
+        i = j = head_a = head_b = 0
+        na, nb = len(a_ts), len(b_ts)
+        while i < na or j < nb:
+            if j >= nb or (i < na and a_ts[i] <= b_ts[j]):
+                t = a_ts[i]; i += 1
+            else:
+                t = b_ts[j]; j += 1
+            cutoff = t - window_ns
+            while head_a < i and a_ts[head_a] < cutoff:
+                head_a += 1
+            while head_b < j and b_ts[head_b] < cutoff:
+                head_b += 1
+            ca = i - head_a
+            cb = j - head_b
+            if ca > 0 and cb > 0 and ca + cb >= min_count:
+                fires.append((t, 0, 1.0, {"unit": "coincidence", "dir": direction}))
+    fires.sort(key=lambda e: e[0])
+    yield from fires
+
 def step_xy_to_ch(inputs: Iterator[Event], width: int, height: int) -> Iterator[Event]:
     max_x = width - 1
     max_y = height - 1
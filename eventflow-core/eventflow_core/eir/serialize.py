@@ -1,6 +1,6 @@
 import json
 from .graph import EIRGraph
-from .ops import LIFNeuron, ExpSynapse, DelayLine, EventFuse, STFT, MelBands, XYToChannel, ShiftXY
+from .ops import LIFNeuron, ExpSynapse, DelayLine, EventFuse, STFT, MelBands, XYToChannel, ShiftXY, FusedOFlowEW
 
 def save(g: EIRGraph, path: str):
     obj = dict(nodes={nid: dict(kind=n.op.kind, name=n.op.name, params=n.op.params) for nid,n in g.nodes.items()},
@@ -19,6 +19,7 @@ def load(path: str) -> EIRGraph:
         "mel": MelBands,
         "xy_to_ch": XYToChannel,
         "shift_xy": ShiftXY,
+        "oflow_ew": FusedOFlowEW,
     }
     for nid, nd in obj["nodes"].items():
         g.add_node(nid, kinds[nd["kind"]](nd["name"], **nd["params"]).as_op())
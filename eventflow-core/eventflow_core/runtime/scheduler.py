@@ -5,7 +5,7 @@ from ..eir.graph import EIRGraph
 from ..eir.ops import (
     step_lif, LIFState, step_exp_syn, step_delay, Event,
     step_stft, step_mel, build_mel_filters,
-    step_xy_to_ch, step_shift_xy,
+    step_xy_to_ch, step_shift_xy, step_oflow_ew,
 )
 from ..eir.types import time_to_ns
 
@@ -50,21 +50,58 @@ def build_exec_nodes(g: EIRGraph) -> Dict[str, ExecNode]:
                         yield (int(t), 0, float(val), {"unit": "coincidence"})
                 nodes[nid] = ExecNode(k, _fuse_native, None)
             else:
-                def _fuse(it_a: Iterator[Event], it_b: Iterator[Event]):
+                def _fuse(it_a: Iterator[Event], it_b: Iterator[Event], win=win, minc=minc):
                     import heapq
+                    from collections import deque
+                    # Quantize the window into <=63 SWAR buckets; bit k of a stream's
+                    # bitmap means "an event landed k buckets ago". The bitmap test is
+                    # conservative (bucket granularity rounds outward), so a zero result
+                    # proves no counterpart is in the window and the exact timestamp
+                    # check can be skipped entirely for sparse streams.
+                    bucket_ns = max(1, -(-win // 63))
+                    n_buckets = win // bucket_ns + 1
+                    window_mask = (1 << (n_buckets + 1)) - 1
+                    mask64 = (1 << 64) - 1
                     heap = []
-                    buf_a, buf_b = [], []
+                    seq = 0
                     for t, c, v, meta in it_a:
-                        heapq.heappush(heap, (t, ("a", (t, c, v, meta))))
+                        heap.append((t, 0, seq, (t, c, v, meta))); seq += 1
                     for t, c, v, meta in it_b:
-                        heapq.heappush(heap, (t, ("b", (t, c, v, meta))))
+                        heap.append((t, 1, seq, (t, c, v, meta))); seq += 1
+                    heapq.heapify(heap)
+                    buf_a: deque = deque()
+                    buf_b: deque = deque()
+                    bits_a = bits_b = 0
+                    last_bucket = 0
                     while heap:
-                        t, (src, ev) = heapq.heappop(heap)
-                        buf = buf_a if src == "a" else buf_b
-                        buf.append(ev)
+                        t, src, _, ev = heapq.heappop(heap)
+                        bucket = t // bucket_ns
+                        shift = bucket - last_bucket
+                        if shift:
+                            if shift >= 64:
+                                # Gap exceeds the bitmap span: everything has
+                                # aged out. Shifting first would build a
+                                # gap-sized big int before the mask drops it.
+                                bits_a = bits_b = 0
+                            else:
+                                bits_a = (bits_a << shift) & mask64
+                                bits_b = (bits_b << shift) & mask64
+                            last_bucket = bucket
+                        if src == 0:
+                            bits_a |= 1
+                            buf_a.append(ev)
+                            other_bits = bits_b
+                        else:
+                            bits_b |= 1
+                            buf_b.append(ev)
+                            other_bits = bits_a
+                        if not (other_bits & window_mask):
+                            continue
                         cutoff = t - win
-                        buf_a[:] = [e for e in buf_a if e[0] >= cutoff]
-                        buf_b[:] = [e for e in buf_b if e[0] >= cutoff]
+                        while buf_a and buf_a[0][0] < cutoff:
+                            buf_a.popleft()
+                        while buf_b and buf_b[0][0] < cutoff:
+                            buf_b.popleft()
                         if len(buf_a) + len(buf_b) >= minc and buf_a and buf_b:
                             yield (t, 0, 1.0, {"unit": "coincidence"})
                 nodes[nid] = ExecNode(k, _fuse, None)
@@ -85,4 +122,8 @@ def build_exec_nodes(g: EIRGraph) -> Dict[str, ExecNode]:
             dx = int(p.get("dx", 0)); dy = int(p.get("dy", 0))
             w = int(p.get("width", 128)); h = int(p.get("height", 128))
             nodes[nid] = ExecNode(k, lambda it, dx=dx, dy=dy, w=w, h=h: step_shift_xy(it, dx, dy, w, h), None)
+        elif k=="oflow_ew":
+            win = time_to_ns(p["window"]); dly = time_to_ns(p["delay"]); minc = int(p["min_count"])
+            w = int(p.get("width", 128)); h = int(p.get("height", 128))
+            nodes[nid] = ExecNode(k, lambda it, win=win, dly=dly, minc=minc, w=w, h=h: step_oflow_ew(it, win, dly, minc, w, h), None)
     return nodes
@@ -0,0 +1,69 @@
+import unittest
+from eventflow_core.eir.graph import EIRGraph
+from eventflow_core.eir.ops import XYToChannel, ShiftXY, DelayLine, EventFuse, FusedOFlowEW
+from eventflow_core.runtime.exec import run_event_mode
+
+def dvs_points(ts, xs, ys):
+    for t, x, y in zip(ts, xs, ys):
+        yield (t, 0, 1.0, {"unit": "pol", "x": int(x), "y": int(y)})
+
+def _unfused_graph(w, h, window, delay, min_count):
+    g = EIRGraph()
+    g.add_node("xy", XYToChannel("xy", width=w, height=h).as_op())
+    g.add_node("shift_e", ShiftXY("shift_e", dx=1, dy=0, width=w, height=h).as_op())
+    g.add_node("delay_e", DelayLine("delay_e", delay=delay).as_op())
+    g.add_node("flow_e", EventFuse("flow_e", window=window, min_count=min_count).as_op())
+    g.add_node("shift_w", ShiftXY("shift_w", dx=-1, dy=0, width=w, height=h).as_op())
+    g.add_node("delay_w", DelayLine("delay_w", delay=delay).as_op())
+    g.add_node("flow_w", EventFuse("flow_w", window=window, min_count=min_count).as_op())
+    g.connect("xy", "ch", "shift_e", "in")
+    g.connect("shift_e", "out", "delay_e", "in")
+    g.connect("xy", "ch", "flow_e", "a")
+    g.connect("delay_e", "out", "flow_e", "b")
+    g.connect("xy", "ch", "shift_w", "in")
+    g.connect("shift_w", "out", "delay_w", "in")
+    g.connect("xy", "ch", "flow_w", "a")
+    g.connect("delay_w", "out", "flow_w", "b")
+    return g
+
+def _fused_graph(w, h, window, delay, min_count):
+    g = EIRGraph()
+    g.add_node("xy", XYToChannel("xy", width=w, height=h).as_op())
+    g.add_node("of", FusedOFlowEW("of", window=window, delay=delay, min_count=min_count, width=w, height=h).as_op())
+    g.connect("xy", "ch", "of", "in")
+    return g
+
+class TestFusedOFlowEW(unittest.TestCase):
+    def test_fused_matches_unfused_pipelines(self):
+        w = h = 8
+        ts = [t * 10**6 for t in (1, 2, 3, 5, 9)]
+        xs = [1, 2, 3, 3, 4]
+        ys = [2, 2, 2, 2, 2]
+        unfused = run_event_mode(
+            _unfused_graph(w, h, "2 ms", "1 ms", 2),
+            {"xy": dvs_points(ts, xs, ys)},
+        )
+        fused = run_event_mode(
+            _fused_graph(w, h, "2 ms", "1 ms", 2),
+            {"xy": dvs_points(ts, xs, ys)},
+        )
+        east = [e[0] for e in fused["of"] if e[3].get("dir") == "east"]
+        west = [e[0] for e in fused["of"] if e[3].get("dir") == "west"]
+        self.assertEqual(east, [e[0] for e in unfused["flow_e"]])
+        self.assertEqual(west, [e[0] for e in unfused["flow_w"]])
+
+    def test_direction_tag_present(self):
+        w = h = 8
+        ts = [t * 10**6 for t in (1, 2)]
+        out = run_event_mode(
+            _fused_graph(w, h, "5 ms", "1 ms", 2),
+            {"xy": dvs_points(ts, [1, 2], [1, 1])},
+        )
+        self.assertGreater(len(out["of"]), 0)
+        for _, _, val, meta in out["of"]:
+            self.assertEqual(meta.get("unit"), "coincidence")
+            self.assertIn(meta.get("dir"), ("east", "west"))
+            self.assertAlmostEqual(val, 1.0, places=6)
+
+if __name__ == "__main__":
+    unittest.main()
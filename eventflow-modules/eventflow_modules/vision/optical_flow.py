@@ -1,11 +1,244 @@
 from __future__ import annotations
 from typing import Optional, Dict, Any
 from eventflow_core.eir.graph import EIRGraph
-from eventflow_core.eir.ops import EventFuse, DelayLine, XYToChannel, ShiftXY
+from eventflow_core.eir.ops import EventFuse, DelayLine, XYToChannel, ShiftXY, FusedOFlowEW
+import array
+import copy
+import functools
 import json
+import mmap
 import numpy as np
 from ..errors import VisionError
-from collections import deque, defaultdict
+from collections import namedtuple
+
+# Compact per-event record for as_tuples=True output modes
+Event = namedtuple("Event", "ts x y pol val")
+
+def _native_fn(name: str):
+    """Return the named native kernel, or None when the extension is absent
+    or disabled via EF_NATIVE. Resolved per call so the env toggle stays live."""
+    if _ef_native_enabled() and _ef_native is not None:
+        return getattr(_ef_native, name, None)
+    return None
+
+
+# Optional C-backed JSON parser; stdlib json remains the fallback
+try:
+    import orjson as _orjson  # type: ignore
+except Exception:
+    _orjson = None  # type: ignore
+
+
+def _loads_record(data):
+    """Decode one JSONL record: orjson when installed, retrying with stdlib
+    json on lines orjson rejects. stdlib writers emit Infinity/NaN tokens
+    for non-finite val fields, which orjson refuses; such files were valid
+    input here (val is discarded downstream) and must stay readable."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            return json.loads(data)
+    return json.loads(data)
+
+# Optional Numba JIT for the coincidence inner loop
+try:
+    from numba import njit as _njit  # type: ignore
+except Exception:
+    _njit = None  # type: ignore
+
+
+def _fuse_pair_py(va, vb, win, minc, out_ts):
+    """Merge one key's A/B timestamps and record fire times into out_ts.
+
+    Sliding window [t - win, t] tracked with head indices into the sorted
+    arrays (a ring buffer without copies). Returns the number of fires.
+    """
+    i = j = head_a = head_b = m = 0
+    na, nb = va.size, vb.size
+    while i < na or j < nb:
+        if j >= nb or (i < na and va[i] <= vb[j]):
+            t = va[i]; i += 1
+        else:
+            t = vb[j]; j += 1
+        cutoff = t - win
+        while head_a < i and va[head_a] < cutoff:
+            head_a += 1
+        while head_b < j and vb[head_b] < cutoff:
+            head_b += 1
+        ca = i - head_a
+        cb = j - head_b
+        if ca > 0 and cb > 0 and ca + cb >= minc:
+            out_ts[m] = t; m += 1
+    return m
+
+
+_fuse_pair_njit = _njit(cache=True)(_fuse_pair_py) if _njit is not None else None
+
+
+# Only parallelize parsing when the file is big enough to amortize the pool
+_PARALLEL_PARSE_MIN_BYTES = 4 * 1024 * 1024
+
+
+def _parse_dvs_chunk(path: str, start: int, end: int):
+    """Worker: parse one newline-aligned byte range into typed column buffers."""
+    header = None
+    ts_buf = array.array("q"); x_buf = array.array("q")
+    y_buf = array.array("q"); pol_buf = array.array("q")
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    for raw in data.splitlines():
+        if not raw.strip():
+            continue
+        ev = _loads_record(raw)
+        if "header" in ev:
+            if header is None:
+                header = ev["header"]
+            continue
+        ts_buf.append(int(ev["ts"]))
+        x, y, pol = ev["idx"]
+        x_buf.append(x); y_buf.append(y); pol_buf.append(pol)
+    return header, ts_buf, x_buf, y_buf, pol_buf
+
+
+def _bounds_filter(ts, x, y, pol, width: int, height: int):
+    """Drop out-of-bounds events with one vectorized mask instead of a
+    per-event conditional chain in the parse loop."""
+    valid = (x >= 0) & (x < width) & (y >= 0) & (y < height) & (pol >= 0) & (pol <= 1)
+    if valid.all():
+        return ts, x, y, pol
+    return ts[valid], x[valid], y[valid], pol[valid]
+
+
+def _parse_dvs_jsonl_soa(path: str, width: int, height: int):
+    """Parse normalized DVS JSONL into (header, ts, x, y, pol) int64 columns.
+
+    Columns preserve file order (no sort). Large files are split into
+    newline-aligned byte ranges parsed concurrently when orjson is available;
+    chunk results are concatenated in range order so the output is identical
+    to the serial pass.
+    """
+    import os
+    size = os.path.getsize(path)
+    workers = os.cpu_count() or 1
+    if _orjson is not None and workers > 1 and size > _PARALLEL_PARSE_MIN_BYTES:
+        from concurrent.futures import ThreadPoolExecutor
+        workers = min(workers, 8)
+        # Round each boundary forward to the byte after the next newline
+        bounds = [0]
+        with open(path, "rb") as f:
+            for i in range(1, workers):
+                pos = size * i // workers
+                if pos <= bounds[-1]:
+                    continue
+                f.seek(pos)
+                f.readline()
+                cut = f.tell()
+                if cut > bounds[-1] and cut < size:
+                    bounds.append(cut)
+        bounds.append(size)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(
+                lambda se: _parse_dvs_chunk(path, se[0], se[1]),
+                zip(bounds[:-1], bounds[1:]),
+            ))
+        header = next((h for h, *_ in parts if h is not None), None)
+        def _cat(idx: int) -> np.ndarray:
+            arrs = [np.frombuffer(p[idx], dtype=np.int64) for p in parts if len(p[idx])]
+            return np.concatenate(arrs) if arrs else np.empty((0,), dtype=np.int64)
+        return header, *_bounds_filter(_cat(1), _cat(2), _cat(3), _cat(4), width, height)
+
+    header = None
+    ts_buf = array.array("q"); x_buf = array.array("q")
+    y_buf = array.array("q"); pol_buf = array.array("q")
+    for ev in _iter_jsonl_records(path):
+        if "header" in ev:
+            if header is None:
+                header = ev["header"]
+            continue
+        ts_buf.append(int(ev["ts"]))
+        x, y, pol = ev["idx"]
+        x_buf.append(x); y_buf.append(y); pol_buf.append(pol)
+
+    def _col(buf: "array.array") -> np.ndarray:
+        return np.frombuffer(buf, dtype=np.int64) if buf else np.empty((0,), dtype=np.int64)
+    return header, *_bounds_filter(_col(ts_buf), _col(x_buf), _col(y_buf), _col(pol_buf), width, height)
+
+
+def _group_ts_by_key(keys: np.ndarray, ts: np.ndarray) -> Dict[int, np.ndarray]:
+    """Split a ts column into per-key arrays, each sorted ascending.
+
+    One lexsort up front replaces re-sorting every group in the fuse loop.
+    """
+    order = np.lexsort((ts, keys))
+    k = keys[order]
+    t = ts[order]
+    starts = np.flatnonzero(np.r_[True, k[1:] != k[:-1]]) if k.size else np.empty((0,), dtype=np.int64)
+    groups: Dict[int, np.ndarray] = {}
+    bounds = starts.tolist() + [k.size]
+    for i in range(len(bounds) - 1):
+        s = bounds[i]
+        groups[int(k[s])] = t[s:bounds[i + 1]]
+    return groups
+
+
+def _events_to_soa(events: list) -> Dict[str, np.ndarray]:
+    """Convert a list of {"ts", "idx": [x,y,pol], "val"} dicts to SoA columns.
+
+    Single pass with indexed fills; handles the empty list naturally.
+    """
+    n = len(events)
+    ts = np.empty(n, dtype=np.int64)
+    x = np.empty(n, dtype=np.int64)
+    y = np.empty(n, dtype=np.int64)
+    pol = np.empty(n, dtype=np.int64)
+    for i, e in enumerate(events):
+        ts[i] = e["ts"]
+        idx = e["idx"]
+        x[i] = idx[0]; y[i] = idx[1]; pol[i] = idx[2]
+    val = np.full((n,), 1.0, dtype=np.float32)
+    return {"ts": ts, "x": x, "y": y, "polarity": pol, "val": val}
+
+
+def _iter_jsonl_records(path: str):
+    """Yield decoded records from a JSONL file.
+
+    Uses orjson over an mmap'd view when available: lines are located with
+    bytes.find and sliced directly, so no per-line str object is created
+    (orjson accepts bytes). Falls back to stdlib json over text lines.
+    """
+    if _orjson is not None:
+        with open(path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                mm = None  # empty file or fd that cannot be mapped
+            if mm is None:
+                for raw in f:
+                    if not raw.strip():
+                        continue
+                    yield _loads_record(raw)
+                return
+            with mm:
+                loads = _loads_record
+                pos = 0
+                n = len(mm)
+                while pos < n:
+                    nl = mm.find(b"\n", pos)
+                    if nl == -1:
+                        nl = n
+                    chunk = mm[pos:nl]
+                    pos = nl + 1
+                    if chunk.strip():
+                        yield loads(chunk)
+    else:
+        with open(path, "r") as f:
+            for line in f:
+                s = line.strip()
+                if not s:
+                    continue
+                yield json.loads(s)
 
 # Optional Rust acceleration for vision
 try:
@@ -28,11 +261,26 @@ def optical_flow(
     - shift_w: shift -x; delayed similarly
     - flow_e/flow_w: coincidence detectors within a small window
     Provide events to node 'xy' input at runtime.
+    Graph templates are cached per parameter set; each call returns a cheap deep copy.
+
+    With params={"fused": True} the shift/delay/fuse pipelines collapse into a
+    single FusedOFlowEW node 'of' whose events carry meta["dir"] east/west.
     """
     p = params or {}
     w = int(p.get("width", 128)); h = int(p.get("height", 128))
     delay = p.get("delay", "1 ms")
+    fused = bool(p.get("fused", False))
+    return copy.deepcopy(_build_optical_flow_template(w, h, window, int(min_coincidences), delay, fused))
+
 
+@functools.lru_cache(maxsize=128)
+def _build_optical_flow_template(w: int, h: int, window: str, min_coincidences: int, delay: str, fused: bool = False) -> EIRGraph:
+    if fused:
+        g = EIRGraph()
+        g.add_node("xy", XYToChannel("xy", width=w, height=h).as_op())
+        g.add_node("of", FusedOFlowEW("of", window=window, delay=delay, min_count=min_coincidences, width=w, height=h).as_op())
+        g.connect("xy", "ch", "of", "in")
+        return g
     g = EIRGraph()
     g.add_node("xy", XYToChannel("xy", width=w, height=h).as_op())
 
@@ -69,6 +317,7 @@ def coincidence_flow_from_jsonl(
     edge_delay_us: int,
     min_count: int,
     as_arrays: bool = False,
+    as_tuples: bool = False,
 ):
     """
     Return (header_dict, events) representing coincidence flow events computed
@@ -78,119 +327,225 @@ def coincidence_flow_from_jsonl(
       {"ts": int, "idx": [x,y,pol], "val": 1.0}
     - Columnar mode (as_arrays=True): events is a dict of NumPy arrays with keys:
       {"ts": int64, "x": int64, "y": int64, "polarity": int64, "val": float32}
+    - Tuple mode (as_tuples=True, ignored when as_arrays=True): events is a
+      list of Event namedtuples (ts, x, y, pol, val) -- one tuple per event
+      instead of a dict plus a nested idx list
 
     Uses the native Rust implementation when available; otherwise falls back to
     a Python reference implementation. Existing callers are unaffected when
-    as_arrays=False (default).
+    as_arrays=False (default). Both output modes share one parse+fuse pass;
+    nothing is recomputed or revalidated when adapting the output shape.
     """
+    width = int(width); height = int(height)
+    window_us = int(window_us); delay_us = int(delay_us)
+    edge_delay_us = int(edge_delay_us); min_count = int(min_count)
     if as_arrays:
         # Prefer native columnar path if available
-        if _ef_native_enabled() and _ef_native is not None and hasattr(_ef_native, "optical_flow_shift_delay_fuse_arrays"):
-            return _ef_native.optical_flow_shift_delay_fuse_arrays(
-                path, int(width), int(height), int(window_us), int(delay_us), int(edge_delay_us), int(min_count)
-            )
+        native = _native_fn("optical_flow_shift_delay_fuse_arrays")
+        if native is not None:
+            return native(path, width, height, window_us, delay_us, edge_delay_us, min_count)
 
         # Python fallback arrays with error normalization (raise VisionError on domain errors)
-        if int(width) <= 0 or int(height) <= 0:
+        if width <= 0 or height <= 0:
             raise VisionError("width/height must be > 0")
-        if int(window_us) <= 0:
+        if window_us <= 0:
             raise VisionError("window_us must be > 0")
-        if int(delay_us) < 0 or int(edge_delay_us) < 0:
+        if delay_us < 0 or edge_delay_us < 0:
             raise VisionError("delay_us and edge_delay_us must be >= 0")
-        if int(min_count) <= 0:
+        if min_count <= 0:
             raise VisionError("min_count must be >= 1")
 
-        # Compute via Python reference then convert to arrays
-        hdr, events = coincidence_flow_from_jsonl(
-            path, int(width), int(height), int(window_us), int(delay_us), int(edge_delay_us), int(min_count), as_arrays=False
+        # Compute once in columnar form; no intermediate list-of-dicts
+        header, ts_o, x_o, y_o, pol_o = _coincidence_flow_py(
+            path, width, height, window_us, delay_us, edge_delay_us, min_count
         )
-        n = len(events)
-        if n == 0:
-            zeros_i64 = np.empty((0,), dtype=np.int64)
-            zeros_f32 = np.empty((0,), dtype=np.float32)
-            arrays = {"ts": zeros_i64, "x": zeros_i64, "y": zeros_i64, "polarity": zeros_i64, "val": zeros_f32}
-            return hdr, arrays
-
-        ts = np.fromiter((e["ts"] for e in events), dtype=np.int64, count=n)
-        x = np.fromiter((e["idx"][0] for e in events), dtype=np.int64, count=n)
-        y = np.fromiter((e["idx"][1] for e in events), dtype=np.int64, count=n)
-        pol = np.fromiter((e["idx"][2] for e in events), dtype=np.int64, count=n)
-        val = np.full((n,), 1.0, dtype=np.float32)
-        arrays = {"ts": ts, "x": x, "y": y, "polarity": pol, "val": val}
-        return hdr, arrays
+        arrays = {
+            "ts": ts_o, "x": x_o, "y": y_o, "polarity": pol_o,
+            "val": np.full((ts_o.size,), 1.0, dtype=np.float32),
+        }
+        return header, arrays
 
-    """
-    Return (header_dict, events_list) representing coincidence flow events computed
-    from a normalized DVS JSONL input. Uses the native Rust implementation when
-    available; otherwise falls back to a Python reference implementation.
+    # Use native if available
+    native = _native_fn("optical_flow_shift_delay_fuse_coo")
+    if native is not None:
+        header, events = native(path, width, height, window_us, delay_us, edge_delay_us, min_count)
+        if as_tuples:
+            events = [Event(e["ts"], e["idx"][0], e["idx"][1], e["idx"][2], e["val"]) for e in events]
+        return header, events
+
+    header, ts_o, x_o, y_o, pol_o = _coincidence_flow_py(
+        path, width, height, window_us, delay_us, edge_delay_us, min_count
+    )
+    cols = zip(ts_o.tolist(), x_o.tolist(), y_o.tolist(), pol_o.tolist())
+    if as_tuples:
+        return header, [Event(t, x, y, pol, 1.0) for t, x, y, pol in cols]
+    return header, [{"ts": t, "idx": [x, y, pol], "val": 1.0} for t, x, y, pol in cols]
+
+
+def _coincidence_flow_py(
+    path: str,
+    width: int,
+    height: int,
+    window_us: int,
+    delay_us: int,
+    edge_delay_us: int,
+    min_count: int,
+):
+    """Shared Python reference: returns (header, ts, x, y, pol) int64 columns
+    sorted by (ts, x, y, pol). Mirrors tests' _python_shift_delay_fuse_ref."""
+    header, ts_arr, x_arr, y_arr, pol_arr = _parse_dvs_jsonl_soa(path, width, height)
+    if header is None:
+        header = {"schema_version": "0.1.0", "dims": ["x", "y", "polarity"], "units": {"time": "us", "value": "dimensionless"}, "dtype": "f32", "layout": "coo"}
+    ts_o, x_o, y_o, pol_o = _coincidence_fuse_soa(
+        ts_arr, x_arr, y_arr, pol_arr, width, height, window_us, int(delay_us + edge_delay_us), min_count
+    )
+    return header, ts_o, x_o, y_o, pol_o
+
+
+def coincidence_flow_from_arrays(
+    ts,
+    x,
+    y,
+    pol,
+    width: int,
+    height: int,
+    window_us: int,
+    delay_us: int,
+    edge_delay_us: int,
+    min_count: int,
+) -> Dict[str, np.ndarray]:
+    """Run the coincidence-flow fuse directly on in-memory event columns.
 
-    Each event in the output is a dict: {"ts": int, "idx": [x,y,pol], "val": 1.0}
+    Skips JSONL I/O and parsing entirely for callers that already hold the
+    events as arrays (a prior pipeline stage or a sensor API). Inputs are
+    filtered to the sensor bounds like the JSONL readers; output matches
+    coincidence_flow_from_jsonl(..., as_arrays=True):
+    {"ts": int64, "x": int64, "y": int64, "polarity": int64, "val": float32}.
     """
-    # Use native if available
-    if _ef_native_enabled() and _ef_native is not None and hasattr(_ef_native, "optical_flow_shift_delay_fuse_coo"):
-        return _ef_native.optical_flow_shift_delay_fuse_coo(
-            path, int(width), int(height), int(window_us), int(delay_us), int(edge_delay_us), int(min_count)
-        )
+    if int(width) <= 0 or int(height) <= 0:
+        raise VisionError("width/height must be > 0")
+    if int(window_us) <= 0:
+        raise VisionError("window_us must be > 0")
+    if int(delay_us) < 0 or int(edge_delay_us) < 0:
+        raise VisionError("delay_us and edge_delay_us must be >= 0")
+    if int(min_count) <= 0:
+        raise VisionError("min_count must be >= 1")
+    ts_arr = np.asarray(ts, dtype=np.int64)
+    x_arr = np.asarray(x, dtype=np.int64)
+    y_arr = np.asarray(y, dtype=np.int64)
+    pol_arr = np.asarray(pol, dtype=np.int64)
+    valid = (x_arr >= 0) & (x_arr < width) & (y_arr >= 0) & (y_arr < height) & (pol_arr >= 0) & (pol_arr <= 1)
+    if not valid.all():
+        ts_arr = ts_arr[valid]; x_arr = x_arr[valid]; y_arr = y_arr[valid]; pol_arr = pol_arr[valid]
+    ts_o, x_o, y_o, pol_o = _coincidence_fuse_soa(
+        ts_arr, x_arr, y_arr, pol_arr, int(width), int(height), int(window_us),
+        int(delay_us) + int(edge_delay_us), int(min_count)
+    )
+    return {"ts": ts_o, "x": x_o, "y": y_o, "polarity": pol_o, "val": np.full((ts_o.size,), 1.0, dtype=np.float32)}
 
-    # Python fallback (mirrors tests' _python_shift_delay_fuse_ref)
-    eff_delay = int(delay_us + edge_delay_us)
-    header = None
-    a_events = []
-    with open(path, "r") as f:
-        for line in f:
-            s = line.strip()
-            if not s:
-                continue
-            ev = json.loads(s)
-            if "header" in ev:
-                header = ev["header"]
-                continue
-            ts = int(ev["ts"])
-            x, y, pol = ev["idx"]
-            if 0 <= x < width and 0 <= y < height and 0 <= pol <= 1:
-                a_events.append({"ts": ts, "idx": [x, y, pol], "val": float(ev.get("val", 1.0))})
-    a_events.sort(key=lambda e: e["ts"])
-
-    # Build A and B (shifted+delayed) streams per coordinate
-    a_map: dict[tuple[int, int, int], list[int]] = defaultdict(list)
-    b_map: dict[tuple[int, int, int], list[int]] = defaultdict(list)
-    for e in a_events:
-        ts = e["ts"]; x, y, pol = e["idx"]
-        a_map[(x, y, pol)].append(ts)
-        b_ts = ts + eff_delay
-        if x + 1 < width:
-            b_map[(x + 1, y, pol)].append(b_ts)
-        if x - 1 >= 0:
-            b_map[(x - 1, y, pol)].append(b_ts)
-
-    # Fuse per coordinate using a sliding window [t - window, t]
-    out: list[dict] = []
+
+def _coincidence_fuse_soa(
+    ts_arr: np.ndarray,
+    x_arr: np.ndarray,
+    y_arr: np.ndarray,
+    pol_arr: np.ndarray,
+    width: int,
+    height: int,
+    window_us: int,
+    eff_delay: int,
+    min_count: int,
+):
+    """Fuse kernel over SoA columns; returns (ts, x, y, pol) sorted columns."""
+    order = np.argsort(ts_arr, kind="stable")
+    ts_arr = ts_arr[order]; x_arr = x_arr[order]; y_arr = y_arr[order]; pol_arr = pol_arr[order]
+
+    # Build A and B (shifted+delayed) streams per coordinate, keyed by the
+    # packed int (x*height + y)*2 + pol. The east/west shifts are one masked
+    # vector op each (shifting x by +-1 adds +-height*2 to the packed key)
+    # instead of two per-event branches.
+    h2 = int(height) * 2
+    a_key = x_arr * h2 + y_arr * 2 + pol_arr
+    b_ts_delayed = ts_arr + eff_delay
+    # Edge-of-sensor checks hoisted out of the event loop: one boolean mask
+    # per direction replaces the per-event x+1 < width / x-1 >= 0 branches.
+    east = x_arr + 1 < width
+    west = x_arr >= 1
+    b_key = np.concatenate([a_key[east] + h2, a_key[west] - h2])
+    b_ts = np.concatenate([b_ts_delayed[east], b_ts_delayed[west]])
+    a_map = _group_ts_by_key(a_key, ts_arr)
+    b_map = _group_ts_by_key(b_key, b_ts)
+
+    # Fuse per coordinate using a sliding window [t - window, t]. Events are
+    # replayed in ts order with A taking precedence at ties, so the window
+    # occupancy seen by each event can be counted with binary searches instead
+    # of a per-event deque sweep: an A event at t sees all A <= t already
+    # processed and only B < t, while a B event at t also sees A == t.
+    win = int(window_us)
+    minc = int(min_count)
+    # Collect one ts chunk per fused key; coordinates are constant per chunk
+    # and expanded with np.repeat, so the final ordering is a single lexsort
+    # on contiguous int64 columns instead of a Python tuple sort.
+    ts_chunks: list[np.ndarray] = []
+    chunk_keys: list[int] = []
+    chunk_lens: list[int] = []
     keys = set(a_map.keys()) | set(b_map.keys())
     for key in keys:
-        va = sorted(a_map.get(key, []))
-        vb = sorted(b_map.get(key, []))
-        i = j = 0
-        buf_a: deque[int] = deque()
-        buf_b: deque[int] = deque()
-        while i < len(va) or j < len(vb):
-            take_a = j >= len(vb) or (i < len(va) and va[i] <= vb[j])
-            if take_a:
-                t = va[i]; i += 1; buf_a.append(t)
-            else:
-                t = vb[j]; j += 1; buf_b.append(t)
-            cutoff = t - int(window_us)
-            while buf_a and buf_a[0] < cutoff: buf_a.popleft()
-            while buf_b and buf_b[0] < cutoff: buf_b.popleft()
-            if buf_a and buf_b and (len(buf_a) + len(buf_b)) >= int(min_count):
-                x, y, pol = key
-                out.append({"ts": t, "idx": [x, y, pol], "val": 1.0})
-    out.sort(key=lambda e: (e["ts"], e["idx"][0], e["idx"][1], e["idx"][2]))
-    if header is None:
-        header = {"schema_version": "0.1.0", "dims": ["x", "y", "polarity"], "units": {"time": "us", "value": "dimensionless"}, "dtype": "f32", "layout": "coo"}
-    return header, out
+        va_l = a_map.get(key)
+        vb_l = b_map.get(key)
+        if va_l is None or vb_l is None:
+            continue  # coincidence requires both streams in the window
+        # Groups come out of _group_ts_by_key already ts-sorted
+        va = va_l
+        vb = vb_l
+        if _fuse_pair_njit is not None:
+            out_ts = np.empty(va.size + vb.size, dtype=np.int64)
+            m = _fuse_pair_njit(va, vb, win, minc, out_ts)
+            if m:
+                ts_chunks.append(out_ts[:m])
+                chunk_keys.append(key)
+                chunk_lens.append(m)
+            continue
+        # A events: own count includes self and every earlier A in window
+        na_a = np.arange(1, va.size + 1) - np.searchsorted(va, va - win, side="left")
+        nb_a = np.searchsorted(vb, va, side="left") - np.searchsorted(vb, va - win, side="left")
+        fire_a = (nb_a >= 1) & (na_a + nb_a >= minc)
+        # B events: A events at the same ts were already processed
+        nb_b = np.arange(1, vb.size + 1) - np.searchsorted(vb, vb - win, side="left")
+        na_b = np.searchsorted(va, vb, side="right") - np.searchsorted(va, vb - win, side="left")
+        fire_b = (na_b >= 1) & (na_b + nb_b >= minc)
+        fires = np.concatenate([va[fire_a], vb[fire_b]])
+        if fires.size:
+            ts_chunks.append(fires)
+            chunk_keys.append(key)
+            chunk_lens.append(int(fires.size))
+
+    if ts_chunks:
+        ts_o = np.concatenate(ts_chunks)
+        key_arr = np.repeat(np.asarray(chunk_keys, dtype=np.int64), np.asarray(chunk_lens))
+        pol_o = key_arr & 1
+        xy = key_arr >> 1
+        x_o, y_o = np.divmod(xy, int(height))
+        order = np.lexsort((pol_o, y_o, x_o, ts_o))
+        ts_o = ts_o[order]; x_o = x_o[order]; y_o = y_o[order]; pol_o = pol_o[order]
+    else:
+        ts_o = x_o = y_o = pol_o = np.empty((0,), dtype=np.int64)
+    return ts_o, x_o, y_o, pol_o
 
 
-def load_events_from_jsonl(path: str, width: int, height: int, as_arrays: bool = False):
+def _compact_arrays(arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Narrow columnar event arrays to compact dtypes: x/y to uint16 and
+    polarity to uint8 (ts stays int64, val float32). Roughly quarters the
+    footprint of the coordinate columns for typical DVS resolutions."""
+    return {
+        "ts": arrays["ts"],
+        "x": arrays["x"].astype(np.uint16),
+        "y": arrays["y"].astype(np.uint16),
+        "polarity": arrays["polarity"].astype(np.uint8),
+        "val": arrays["val"],
+    }
+
+
+def load_events_from_jsonl(path: str, width: int, height: int, as_arrays: bool = False, as_tuples: bool = False, dtypes: str = "wide"):
     """
     Pass-through reader for normalized DVS JSONL.
 
@@ -198,6 +553,11 @@ def load_events_from_jsonl(path: str, width: int, height: int, as_arrays: bool =
       {"ts": int, "idx": [x, y, pol], "val": 1.0}
     - When as_arrays=True, returns (header_dict, arrays_dict) with keys:
       {"ts": int64, "x": int64, "y": int64, "polarity": int64, "val": float32}
+    - When as_tuples=True (ignored when as_arrays=True), events are Event
+      namedtuples (ts, x, y, pol, val) instead of dicts
+    - dtypes="compact" (with as_arrays=True) narrows x/y to uint16 and
+      polarity to uint8, quartering coordinate memory traffic for
+      bandwidth-bound consumers; "wide" keeps the int64 columns above
 
     Preserves dims from source header when present. Domain errors (width/height <= 0)
     raise VisionError. I/O errors propagate as IOError.
@@ -205,75 +565,55 @@ def load_events_from_jsonl(path: str, width: int, height: int, as_arrays: bool =
     w = int(width); h = int(height)
     if w <= 0 or h <= 0:
         raise VisionError("width/height must be > 0")
+    if dtypes not in ("wide", "compact"):
+        raise VisionError("dtypes must be 'wide' or 'compact'")
+    compact = as_arrays and dtypes == "compact"
 
     if as_arrays:
         # Prefer native columnar path
-        if _ef_native_enabled() and _ef_native is not None and hasattr(_ef_native, "optical_flow_coo_arrays"):
-            return _ef_native.optical_flow_coo_arrays(path, w, h)
+        native = _native_fn("optical_flow_coo_arrays")
+        if native is not None:
+            header, arrays = native(path, w, h)
+            return header, (_compact_arrays(arrays) if compact else arrays)
 
-        # Fallback: obtain list-of-dicts, then convert to arrays
-        try:
-            if _ef_native_enabled() and _ef_native is not None and hasattr(_ef_native, "optical_flow_coo_from_jsonl"):
-                hdr, events = _ef_native.optical_flow_coo_from_jsonl(path, w, h, 0, 0, 0, 1)
-            else:
-                hdr = None
-                events = []
-                with open(path, "r") as f:
-                    for line in f:
-                        s = line.strip()
-                        if not s:
-                            continue
-                        ev = json.loads(s)
-                        if "header" in ev:
-                            hdr = ev["header"]
-                            continue
-                        ts = int(ev["ts"])
-                        x, y, pol = ev["idx"]
-                        if 0 <= x < w and 0 <= y < h and 0 <= pol <= 1:
-                            events.append({"ts": ts, "idx": [x, y, pol], "val": 1.0})
-                events.sort(key=lambda e: (e["ts"], e["idx"][0], e["idx"][1], e["idx"][2]))
-                if hdr is None:
-                    hdr = {"schema_version": "0.1.0", "dims": ["x", "y", "polarity"], "units": {"time": "us", "value": "dimensionless"}, "dtype": "f32", "layout": "coo"}
-        except OSError:
-            # Keep I/O as IOError
-            raise
-
-        n = len(events)
-        if n == 0:
-            zeros_i64 = np.empty((0,), dtype=np.int64)
-            zeros_f32 = np.empty((0,), dtype=np.float32)
-            arrays = {"ts": zeros_i64, "x": zeros_i64, "y": zeros_i64, "polarity": zeros_i64, "val": zeros_f32}
-            return hdr, arrays
-
-        ts = np.fromiter((e["ts"] for e in events), dtype=np.int64, count=n)
-        x = np.fromiter((e["idx"][0] for e in events), dtype=np.int64, count=n)
-        y = np.fromiter((e["idx"][1] for e in events), dtype=np.int64, count=n)
-        pol = np.fromiter((e["idx"][2] for e in events), dtype=np.int64, count=n)
-        val = np.full((n,), 1.0, dtype=np.float32)
-        arrays = {"ts": ts, "x": x, "y": y, "polarity": pol, "val": val}
-        return hdr, arrays
+        # Fallback: native list-of-dicts if present, else the SoA parser
+        native = _native_fn("optical_flow_coo_from_jsonl")
+        if native is not None:
+            hdr, events = native(path, w, h, 0, 0, 0, 1)
+            arrays = _events_to_soa(events)
+            return hdr, (_compact_arrays(arrays) if compact else arrays)
+
+        # Columnar parse with one vectorized bounds filter; no dict per event
+        hdr, ts, x, y, pol = _parse_dvs_jsonl_soa(path, w, h)
+        if hdr is None:
+            hdr = {"schema_version": "0.1.0", "dims": ["x", "y", "polarity"], "units": {"time": "us", "value": "dimensionless"}, "dtype": "f32", "layout": "coo"}
+        order = np.lexsort((pol, y, x, ts))
+        ts = ts[order]; x = x[order]; y = y[order]; pol = pol[order]
+        arrays = {"ts": ts, "x": x, "y": y, "polarity": pol, "val": np.full((ts.size,), 1.0, dtype=np.float32)}
+        return hdr, (_compact_arrays(arrays) if compact else arrays)
 
     # List-of-dicts output
-    if _ef_native_enabled() and _ef_native is not None and hasattr(_ef_native, "optical_flow_coo_from_jsonl"):
-        return _ef_native.optical_flow_coo_from_jsonl(path, w, h, 0, 0, 0, 1)
+    native = _native_fn("optical_flow_coo_from_jsonl")
+    if native is not None:
+        header, events = native(path, w, h, 0, 0, 0, 1)
+        if as_tuples:
+            events = [Event(e["ts"], e["idx"][0], e["idx"][1], e["idx"][2], e["val"]) for e in events]
+        return header, events
 
     # Pure-Python fallback pass-through
     header = None
     events = []
-    with open(path, "r") as f:
-        for line in f:
-            s = line.strip()
-            if not s:
-                continue
-            ev = json.loads(s)
-            if "header" in ev:
-                header = ev["header"]
-                continue
-            ts = int(ev["ts"])
-            x, y, pol = ev["idx"]
-            if 0 <= x < w and 0 <= y < h and 0 <= pol <= 1:
-                events.append({"ts": ts, "idx": [x, y, pol], "val": 1.0})
-    events.sort(key=lambda e: (e["ts"], e["idx"][0], e["idx"][1], e["idx"][2]))
+    for ev in _iter_jsonl_records(path):
+        if "header" in ev:
+            header = ev["header"]
+            continue
+        ts = int(ev["ts"])
+        x, y, pol = ev["idx"]
+        if 0 <= x < w and 0 <= y < h and 0 <= pol <= 1:
+            events.append(Event(ts, x, y, pol, 1.0))
+    events.sort()
+    if not as_tuples:
+        events = [{"ts": e.ts, "idx": [e.x, e.y, e.pol], "val": e.val} for e in events]
     if header is None:
         header = {"schema_version": "0.1.0", "dims": ["x", "y", "polarity"], "units": {"time": "us", "value": "dimensionless"}, "dtype": "f32", "layout": "coo"}
     return header, events
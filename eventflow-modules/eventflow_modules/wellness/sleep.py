@@ -1,8 +1,21 @@
 from __future__ import annotations
 from typing import Optional, Dict, Any
+import copy
+import functools
 from eventflow_core.eir.graph import EIRGraph
 from eventflow_core.eir.ops import DelayLine, EventFuse
 
+@functools.lru_cache(maxsize=128)
+def _build_sleep_template(window: str) -> EIRGraph:
+    g = EIRGraph()
+    g.add_node("id",    DelayLine("id", delay="0 ms").as_op())
+    g.add_node("delay", DelayLine("delay", delay=window).as_op())
+    g.add_node("sleep", EventFuse("sleep", window=window, min_count=2).as_op())
+    g.connect("id", "out", "delay", "in")
+    g.connect("id", "out", "sleep", "a")
+    g.connect("delay", "out", "sleep", "b")
+    return g
+
 def sleep_staging(
     bio_streams: Any,
     window: str = "30 s",
@@ -11,12 +24,6 @@ def sleep_staging(
     """
     Sleep staging proxy: periodicity/coincidence over epoch window.
     Provide events to node 'id' at runtime.
+    Graph templates are cached per window; each call returns a cheap deep copy.
     """
-    g = EIRGraph()
-    g.add_node("id",    DelayLine("id", delay="0 ms").as_op())
-    g.add_node("delay", DelayLine("delay", delay=window).as_op())
-    g.add_node("sleep", EventFuse("sleep", window=window, min_count=2).as_op())
-    g.connect("id", "out", "delay", "in")
-    g.connect("id", "out", "sleep", "a")
-    g.connect("delay", "out", "sleep", "b")
-    return g
+    return copy.deepcopy(_build_sleep_template(window))
@@ -1,8 +1,21 @@
 from __future__ import annotations
 from typing import Optional, Dict, Any
+import copy
+import functools
 from eventflow_core.eir.graph import EIRGraph
 from eventflow_core.eir.ops import DelayLine, EventFuse
 
+@functools.lru_cache(maxsize=128)
+def _build_stress_template(window: str) -> EIRGraph:
+    g = EIRGraph()
+    g.add_node("id",    DelayLine("id", delay="0 ms").as_op())
+    g.add_node("delay", DelayLine("delay", delay=window).as_op())
+    g.add_node("stress", EventFuse("stress", window=window, min_count=3).as_op())
+    g.connect("id", "out", "delay", "in")
+    g.connect("id", "out", "stress", "a")
+    g.connect("delay", "out", "stress", "b")
+    return g
+
 def stress_index(
     bio_streams: Any,
     window: str = "60 s",
@@ -11,12 +24,6 @@ def stress_index(
     """
     Stress proxy: bursts of activity within a minute window.
     Provide events to node 'id' at runtime.
+    Graph templates are cached per window; each call returns a cheap deep copy.
     """
-    g = EIRGraph()
-    g.add_node("id",    DelayLine("id", delay="0 ms").as_op())
-    g.add_node("delay", DelayLine("delay", delay=window).as_op())
-    g.add_node("stress", EventFuse("stress", window=window, min_count=3).as_op())
-    g.connect("id", "out", "delay", "in")
-    g.connect("id", "out", "stress", "a")
-    g.connect("delay", "out", "stress", "b")
-    return g
+    return copy.deepcopy(_build_stress_template(window))
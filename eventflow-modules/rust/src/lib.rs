@@ -5,7 +5,7 @@ use pyo3::types::{PyDict, PyList};
 use pyo3::exceptions::{PyIOError, PyValueError};
 use pyo3::create_exception;
 use once_cell::sync::OnceCell;
-use std::sync::RwLock;
+use std::sync::{Mutex, RwLock};
 
 use serde::Deserialize;
 use serde_json::Value;
@@ -17,11 +17,40 @@ use std::io::{BufRead, BufReader};
 create_exception!(eventflow_modules_vision_native, VisionError, pyo3::exceptions::PyException);
 
 /// Global optional logging sink (callable)
-/// Callable signature: sink(level: str, message: str)
+/// Callable signature: sink(batch: list[tuple[str, str]])
 static LOG_SINK: OnceCell<RwLock<Option<Py<PyAny>>>> = OnceCell::new();
 
+/// Messages buffered between flushes so kernels never call into Python
+/// per message; delivered to the sink as one batch.
+static LOG_BUF: OnceCell<Mutex<Vec<(String, String)>>> = OnceCell::new();
+
+/// Buffer high-water mark at which log_emit flushes inline.
+const LOG_BATCH_MAX: usize = 256;
+
+fn drain_log_buf(py: Python<'_>) {
+    let batch: Vec<(String, String)> = match LOG_BUF.get() {
+        Some(cell) => {
+            let mut guard = cell.lock().unwrap();
+            if guard.is_empty() {
+                return;
+            }
+            std::mem::take(&mut *guard)
+        }
+        None => return,
+    };
+    if let Some(lock) = LOG_SINK.get() {
+        if let Ok(guard) = lock.read() {
+            if let Some(sink) = guard.as_ref() {
+                let _ = sink.bind(py).call1((batch,));
+            }
+        }
+    }
+}
+
 #[pyfunction]
-fn set_log_sink(sink: Option<Py<PyAny>>) -> PyResult<()> {
+fn set_log_sink(py: Python<'_>, sink: Option<Py<PyAny>>) -> PyResult<()> {
+    // Deliver anything still buffered to the outgoing sink first.
+    drain_log_buf(py);
     let cell = LOG_SINK.get_or_init(|| RwLock::new(None));
     let mut guard = cell.write().unwrap();
     *guard = sink;
@@ -30,13 +59,29 @@ fn set_log_sink(sink: Option<Py<PyAny>>) -> PyResult<()> {
 
 #[pyfunction]
 fn log_emit(py: Python<'_>, level: &str, message: &str) -> PyResult<()> {
-    if let Some(lock) = LOG_SINK.get() {
-        if let Ok(guard) = lock.read() {
-            if let Some(sink) = guard.as_ref() {
-                let _ = sink.bind(py).call1((level, message));
-            }
-        }
+    // No sink registered: drop without buffering.
+    let have_sink = LOG_SINK
+        .get()
+        .and_then(|l| l.read().ok().map(|g| g.is_some()))
+        .unwrap_or(false);
+    if !have_sink {
+        return Ok(());
     }
+    let cell = LOG_BUF.get_or_init(|| Mutex::new(Vec::new()));
+    let flush_now = {
+        let mut guard = cell.lock().unwrap();
+        guard.push((level.to_string(), message.to_string()));
+        guard.len() >= LOG_BATCH_MAX
+    };
+    if flush_now {
+        drain_log_buf(py);
+    }
+    Ok(())
+}
+
+#[pyfunction]
+fn flush_log_sink(py: Python<'_>) -> PyResult<()> {
+    drain_log_buf(py);
     Ok(())
 }
 
@@ -682,5 +727,6 @@ fn optical_flow_coo_from_jsonl<'py>(
         m.add_function(wrap_pyfunction!(optical_flow_shift_delay_fuse_arrays, m)?)?;
         m.add_function(wrap_pyfunction!(set_log_sink, m)?)?;
         m.add_function(wrap_pyfunction!(log_emit, m)?)?;
+        m.add_function(wrap_pyfunction!(flush_log_sink, m)?)?;
         Ok(())
     }
\ No newline at end of file
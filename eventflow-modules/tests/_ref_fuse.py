@@ -0,0 +1,481 @@
+"""Shared pure-Python reference implementation for the optical-flow tests.
+
+The benchmark suite and the performance gates compare the native kernels
+against the same Python reference; this module holds the parse and
+shift/delay/fuse machinery once so the two test files cannot drift apart.
+The hot loops are numba-jitted when numba is importable and fall back to
+equivalent NumPy formulations otherwise. Test-support code only, not part
+of the package.
+"""
+from __future__ import annotations
+import array
+import functools
+import json
+import os
+import numpy as np
+
+# Optional C-backed JSON parser for the Python reference paths; JSON decoding
+# dominates their wall time, and orjson accepts bytes lines directly. Both
+# the trace parse and the golden-trace load go through _loads so CI without
+# orjson falls back to stdlib json transparently.
+try:
+    import orjson as _orjson  # type: ignore
+except Exception:
+    _orjson = None  # type: ignore
+
+_loads = _orjson.loads if _orjson is not None else json.loads
+
+
+def _scan_event_line(line):
+    """Parse one fixed-schema event line {"ts":T,"idx":[x,y,p],"val":V} by
+    byte offsets, tolerating the spaced json.dumps variant. Returns the
+    (ts, x, y, pol, val) tuple or None when the line has no "ts" key;
+    raises ValueError on anything that does not match the schema."""
+    a = line.find(b'"ts"')
+    if a == -1:
+        return None
+    c = line.index(b':', a)
+    d = line.index(b',', c)
+    ts = int(line[c + 1:d])
+    i = line.index(b'[', d)
+    j = line.index(b',', i)
+    k = line.index(b',', j + 1)
+    l = line.index(b']', k + 1)
+    x = int(line[i + 1:j]); y = int(line[j + 1:k]); pol = int(line[k + 1:l])
+    v = line.find(b'"val"', l)
+    if v == -1:
+        val = 1.0
+    else:
+        c2 = line.index(b':', v)
+        e = line.find(b',', c2)
+        if e == -1:
+            e = line.index(b'}', c2)
+        val = float(line[c2 + 1:e])
+    return ts, x, y, pol, val
+
+
+# Optional Numba JIT for the fuse inner loop of the Python reference
+try:
+    from numba import njit as _njit  # type: ignore
+except Exception:
+    _njit = None  # type: ignore
+
+
+def _parse_event_lines_py(buf, width, height, ts, x, y, pol, val):
+    """Single-pass parse of fixed-schema event lines out of a raw byte buffer.
+
+    One loop walks the buffer byte by byte: find "ts", parse the integer,
+    parse the three ints inside "idx":[...], parse the optional "val" float,
+    and write the row. Out-of-bounds rows are rejected branchlessly (the row
+    is written, then n advances only when the bounds test passes). Lines
+    without a "ts" key (the header) are skipped; a line that has "ts" but
+    does not match the schema aborts with -1 so the caller can fall back to
+    the per-line scanner. Returns the number of rows written.
+    """
+    size = buf.size
+    n = 0
+    i = 0
+    while i < size:
+        j = i
+        while j < size and buf[j] != 10:
+            j += 1
+        # locate "ts"
+        p = -1
+        k = i
+        while k + 3 < j:
+            if buf[k] == 34 and buf[k + 1] == 116 and buf[k + 2] == 115 and buf[k + 3] == 34:
+                p = k + 4
+                break
+            k += 1
+        if p == -1:
+            i = j + 1
+            continue
+        # ':' then the timestamp integer
+        k = p
+        while k < j and buf[k] != 58:
+            k += 1
+        if k >= j:
+            return -1
+        k += 1
+        while k < j and buf[k] == 32:
+            k += 1
+        neg = False
+        if k < j and buf[k] == 45:
+            neg = True
+            k += 1
+        if k >= j or buf[k] < 48 or buf[k] > 57:
+            return -1
+        tval = 0
+        while k < j and 48 <= buf[k] <= 57:
+            tval = tval * 10 + (buf[k] - 48)
+            k += 1
+        if neg:
+            tval = -tval
+        # '[' then the three idx ints
+        while k < j and buf[k] != 91:
+            k += 1
+        if k >= j:
+            return -1
+        k += 1
+        xv = 0
+        yv = 0
+        pv = 0
+        for c in range(3):
+            while k < j and not (48 <= buf[k] <= 57 or buf[k] == 45):
+                if buf[k] == 93:
+                    return -1
+                k += 1
+            if k >= j:
+                return -1
+            negc = False
+            if buf[k] == 45:
+                negc = True
+                k += 1
+            if k >= j or not (48 <= buf[k] <= 57):
+                return -1
+            iv = 0
+            while k < j and 48 <= buf[k] <= 57:
+                iv = iv * 10 + (buf[k] - 48)
+                k += 1
+            if negc:
+                iv = -iv
+            if c == 0:
+                xv = iv
+            elif c == 1:
+                yv = iv
+            else:
+                pv = iv
+        # optional "val" float
+        vval = 1.0
+        p = -1
+        m = k
+        while m + 4 < j:
+            if buf[m] == 34 and buf[m + 1] == 118 and buf[m + 2] == 97 and buf[m + 3] == 108 and buf[m + 4] == 34:
+                p = m + 5
+                break
+            m += 1
+        if p != -1:
+            k = p
+            while k < j and buf[k] != 58:
+                k += 1
+            if k >= j:
+                return -1
+            k += 1
+            while k < j and buf[k] == 32:
+                k += 1
+            negv = False
+            if k < j and buf[k] == 45:
+                negv = True
+                k += 1
+            # Exact mantissa-as-int parse: value = mant * 10**dec computed
+            # with a single rounded multiply or divide of exact operands, so
+            # the result is bit-identical to float()/strtod. Bail out (-1)
+            # when exactness can't be guaranteed.
+            mant = 0
+            nd = 0
+            while k < j and 48 <= buf[k] <= 57:
+                mant = mant * 10 + (buf[k] - 48)
+                nd += 1
+                k += 1
+            fd = 0
+            if k < j and buf[k] == 46:
+                k += 1
+                while k < j and 48 <= buf[k] <= 57:
+                    mant = mant * 10 + (buf[k] - 48)
+                    nd += 1
+                    fd += 1
+                    k += 1
+            ex = 0
+            if k < j and (buf[k] == 101 or buf[k] == 69):
+                k += 1
+                nege = False
+                if k < j and (buf[k] == 45 or buf[k] == 43):
+                    nege = buf[k] == 45
+                    k += 1
+                while k < j and 48 <= buf[k] <= 57:
+                    ex = ex * 10 + (buf[k] - 48)
+                    k += 1
+                if nege:
+                    ex = -ex
+            if nd > 15:
+                return -1
+            dec = ex - fd
+            if dec >= 0:
+                if dec > 22:
+                    return -1
+                fv = mant * 10.0 ** dec
+            else:
+                if dec < -22:
+                    return -1
+                fv = mant / 10.0 ** (-dec)
+            vval = -fv if negv else fv
+        ts[n] = tval
+        x[n] = xv
+        y[n] = yv
+        pol[n] = pv
+        val[n] = vval
+        ok = (0 <= xv < width) and (0 <= yv < height) and (0 <= pv <= 1)
+        n += 1 if ok else 0
+        i = j + 1
+    return n
+
+
+_parse_event_lines_njit = _njit(cache=True, boundscheck=False, nogil=True)(_parse_event_lines_py) if _njit is not None else None
+
+
+def _fuse_one_key_py(va, vb, window_us, min_count, out):
+    """Fuse one key's sorted A/B timestamp arrays; write fire times into out.
+
+    Sliding window [t - window_us, t] tracked with head indices into the
+    arrays (a ring buffer without pops). Deque-free on purpose: the same
+    source compiles unchanged under numba. Returns the number of fires.
+    """
+    i = j = head_a = head_b = m = 0
+    na, nb = va.size, vb.size
+    while i < na or j < nb:
+        if j >= nb or (i < na and va[i] <= vb[j]):
+            t = va[i]; i += 1
+        else:
+            t = vb[j]; j += 1
+        cutoff = t - window_us
+        while head_a < i and va[head_a] < cutoff:
+            head_a += 1
+        while head_b < j and vb[head_b] < cutoff:
+            head_b += 1
+        ca = i - head_a
+        cb = j - head_b
+        if ca > 0 and cb > 0 and ca + cb >= min_count:
+            out[m] = t; m += 1
+    return m
+
+
+_fuse_one_key_njit = _njit(cache=True, boundscheck=False, nogil=True)(_fuse_one_key_py) if _njit is not None else None
+
+# Keys are independent; threads only pay off once there are enough of them
+# to amortize the pool (the nogil kernel runs truly concurrently).
+_PARALLEL_FUSE_MIN_KEYS = 256
+
+def _fuse_one_key_searchsorted(va, vb, window_us, min_count):
+    """Closed-form fuse for one key via binary searches.
+
+    Events replay in ts order with A first at ties, so an A event at t sees
+    A <= t up to itself and only B < t, while a B event at t sees all A <= t
+    and B <= t up to itself. Four searchsorted sweeps per key replace the
+    per-event window walk when the numba kernel is unavailable.
+    """
+    na_a = np.arange(1, va.size + 1) - np.searchsorted(va, va - window_us, side="left")
+    nb_a = np.searchsorted(vb, va, side="left") - np.searchsorted(vb, va - window_us, side="left")
+    fire_a = (nb_a >= 1) & (na_a + nb_a >= min_count)
+    nb_b = np.arange(1, vb.size + 1) - np.searchsorted(vb, vb - window_us, side="left")
+    na_b = np.searchsorted(va, vb, side="right") - np.searchsorted(va, vb - window_us, side="left")
+    fire_b = (na_b >= 1) & (na_b + nb_b >= min_count)
+    return np.sort(np.concatenate([va[fire_a], vb[fire_b]]))
+
+
+def _parse_coo_soa_compiled(path: str, width: int, height: int):
+    """mmap the file and run the compiled parser over its raw bytes.
+
+    Parse, bounds filter and SoA build happen in one jitted loop with no
+    per-event Python object. Returns the same tuple as _parse_coo_soa, or
+    None when the kernel reports a schema mismatch so the caller can fall
+    back to the per-line scanner.
+    """
+    import mmap
+    with open(path, "rb") as f:
+        first = f.readline()
+        try:
+            # Cold pagecache (fresh CI runners): tell the kernel the whole
+            # file is about to be streamed so readahead runs ahead of the
+            # parser instead of faulting page by page.
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        except (AttributeError, OSError):
+            pass
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    except (AttributeError, ValueError, OSError):
+        pass
+    buf = np.frombuffer(mm, dtype=np.uint8)
+    cap = int(np.count_nonzero(buf == 10)) + 1
+    ts = np.empty(cap, np.int64)
+    x = np.empty(cap, np.int64)
+    y = np.empty(cap, np.int64)
+    pol = np.empty(cap, np.int64)
+    val = np.empty(cap, np.float64)
+    n = _parse_event_lines_njit(buf, width, height, ts, x, y, pol, val)
+    # the buffer view must drop before the mapping can close
+    del buf
+    mm.close()
+    if n < 0:
+        return None
+    header = _loads(first)["header"] if b'"header"' in first else None
+    ts = ts[:n]; x = x[:n]; y = y[:n]; pol = pol[:n]; val = val[:n]
+    order = np.lexsort((pol, y, x, ts))
+    return header, ts[order], x[order], y[order], pol[order], val[order]
+
+
+def _parse_coo_soa(path: str, width: int, height: int):
+    """Parse normalized DVS JSONL into bounds-filtered, sorted SoA columns.
+
+    Returns (header, ts, x, y, pol, val). The bounds check is one vectorized
+    mask and the ordering one lexsort instead of a Python comparator sort.
+    Either way the file is consumed in a single pass straight into column
+    storage -- no intermediate list of dicts is ever built and rewalked.
+    """
+    if _parse_event_lines_njit is not None:
+        res = _parse_coo_soa_compiled(path, width, height)
+        if res is not None:
+            return res
+    header = None
+    # 8 bytes per element in machine-typed buffers, versus ~240 per staged
+    # dict on CPython; np.frombuffer views them zero-copy afterwards.
+    ts_buf = array.array("q"); x_buf = array.array("q")
+    y_buf = array.array("q"); pol_buf = array.array("q")
+    val_buf = array.array("d")
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            # Fixed-schema byte scan first; general JSON parse only for
+            # header lines and anything the scanner cannot place.
+            try:
+                rec = _scan_event_line(line)
+            except ValueError:
+                rec = None
+            if rec is None:
+                ev = _loads(line)
+                if "header" in ev:
+                    header = ev["header"]
+                    continue
+                idx = ev.get("idx", [])
+                if not isinstance(idx, list) or len(idx) != 3:
+                    continue
+                rec = (int(ev["ts"]), idx[0], idx[1], idx[2], float(ev.get("val", 1.0)))
+            ts_buf.append(rec[0]); x_buf.append(rec[1])
+            y_buf.append(rec[2]); pol_buf.append(rec[3])
+            val_buf.append(rec[4])
+    ts = np.frombuffer(ts_buf, dtype=np.int64) if ts_buf else np.empty(0, np.int64)
+    x = np.frombuffer(x_buf, dtype=np.int64) if x_buf else np.empty(0, np.int64)
+    y = np.frombuffer(y_buf, dtype=np.int64) if y_buf else np.empty(0, np.int64)
+    pol = np.frombuffer(pol_buf, dtype=np.int64) if pol_buf else np.empty(0, np.int64)
+    val = np.frombuffer(val_buf, dtype=np.float64) if val_buf else np.empty(0, np.float64)
+    m = (x >= 0) & (x < width) & (y >= 0) & (y < height) & (pol >= 0) & (pol <= 1)
+    if not m.all():
+        ts = ts[m]; x = x[m]; y = y[m]; pol = pol[m]; val = val[m]
+    order = np.lexsort((pol, y, x, ts))
+    return header, ts[order], x[order], y[order], pol[order], val[order]
+
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_coo_soa_cached(path: str, width: int, height: int):
+    """_parse_coo_soa memoized per (path, width, height).
+
+    Traces are immutable for the lifetime of a test run, so parametrized
+    tests and parity checks share one decode. Callers must not mutate the
+    returned arrays. Benchmarks that deliberately measure ingest should
+    keep calling the uncached _parse_coo_soa."""
+    return _parse_coo_soa(path, width, height)
+
+def _arrays_to_events(ts, x, y, pol, val):
+    """Materialize SoA columns as the list-of-dicts event form."""
+    return [
+        {"ts": t, "idx": [a, b, c], "val": v}
+        for t, a, b, c, v in zip(ts.tolist(), x.tolist(), y.tolist(), pol.tolist(), val.tolist())
+    ]
+
+
+def _shift_delay_fuse_arrays(ts_col, x_col, y_col, pol_col, width: int, height: int, window_us: int, delay_us: int, edge_delay_us: int, min_count: int):
+    """Shift(+/-1 x) + delay + coincidence fuse over pre-parsed SoA columns.
+
+    Streams are grouped by the packed key (x*height + y)*2 + pol (one int64
+    in place of a boxed (ts, (x, y, pol), val) tuple): one lexsort
+    over a combined (key, ts, src) array replaces the dicts of per-tuple-key
+    lists and their per-key re-sorts, so no ephemeral (x, y, pol) tuples are
+    allocated or hashed per event. Shifting x by +-1 is an offset of
+    +-height*2 on the packed key, applied with one masked vector op per side.
+    Segments come out of the lexsort already in ascending packed-key order,
+    so the fuse walks the combined buffers monotonically -- each segment is
+    one contiguous slice, never a jump back. Past the parse, every per-event
+    step runs on flat int64/int8 columns; no dicts or deques remain.
+    """
+    eff_delay = int(delay_us + edge_delay_us)
+    window_us = int(window_us); min_count = int(min_count)
+    height = int(height)
+    h2 = height * 2
+    a_key = x_col * h2 + y_col * 2 + pol_col
+    # B streams are pure column arithmetic on the A columns: one add for the
+    # delay, one mask per side for the shift. No per-event dicts are built.
+    b_ts = ts_col + eff_delay
+    east = x_col + 1 < width
+    west = x_col >= 1
+    key_all = np.concatenate([a_key, a_key[east] + h2, a_key[west] - h2])
+    ts_all = np.concatenate([ts_col, b_ts[east], b_ts[west]])
+    src_all = np.concatenate([
+        np.zeros(a_key.size, dtype=np.int8),
+        np.ones(key_all.size - a_key.size, dtype=np.int8),
+    ])
+    # This one stable sort is also the A/B stream merge; no Python-level
+    # heapq.merge or pairwise two-pointer pass ever touches the events.
+    order = np.lexsort((src_all, ts_all, key_all))
+    k_s = key_all[order]; t_s = ts_all[order]; s_s = src_all[order]
+    starts = np.flatnonzero(np.r_[True, k_s[1:] != k_s[:-1]]) if k_s.size else np.empty(0, np.int64)
+    bounds = starts.tolist() + [k_s.size]
+    def _fuse_segment(i):
+        lo, hi = bounds[i], bounds[i + 1]
+        seg_src = s_s[lo:hi]
+        seg_ts = t_s[lo:hi]
+        # va/vb come out of the (key, ts, src) lexsort already ts-sorted;
+        # no per-key re-sort is needed
+        va = np.ascontiguousarray(seg_ts[seg_src == 0])
+        vb = np.ascontiguousarray(seg_ts[seg_src == 1])
+        if va.size == 0 or vb.size == 0:
+            return None  # coincidence needs both streams present
+        if _fuse_one_key_njit is not None:
+            out_ts = np.empty(va.size + vb.size, dtype=np.int64)
+            m = _fuse_one_key_njit(va, vb, window_us, min_count, out_ts)
+            fires = out_ts[:m]
+        else:
+            fires = _fuse_one_key_searchsorted(va, vb, window_us, min_count)
+        return (int(k_s[lo]), fires) if fires.size else None
+
+    # Parallelism is per packed key rather than per shift direction: the
+    # east/west split only ever gave 2-way concurrency, while independent
+    # key segments scale with the core count (nogil kernel, so threads
+    # suffice -- no process spawn or pickling).
+    n_seg = len(bounds) - 1
+    workers = os.cpu_count() or 1
+    if _fuse_one_key_njit is not None and workers > 1 and n_seg >= _PARALLEL_FUSE_MIN_KEYS:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(workers, 8)) as pool:
+            results = list(pool.map(_fuse_segment, range(n_seg), chunksize=64))
+    else:
+        results = [_fuse_segment(i) for i in range(n_seg)]
+
+    chunks = [res for res in results if res is not None]
+    if not chunks:
+        return []
+    # Canonicalize once: per-segment fires are concatenated unordered and
+    # the final lexsort below is the only full sort the output ever sees.
+    # Were dedup ever needed, it would be the adjacent-equal mask over these
+    # sorted columns, not a hash set -- but replay semantics keep duplicates.
+    # Order via one C-level lexsort on packed columns, then materialize the
+    # dicts already sorted -- no per-comparison key tuples and no set-of-
+    # tuples dedup: an A and a B event firing at the same (ts, key) are
+    # distinct fires in the replay semantics, so duplicates are kept.
+    ts_o = np.concatenate([fires for _, fires in chunks])
+    key_o = np.repeat(
+        np.asarray([key for key, _ in chunks], dtype=np.int64),
+        [fires.size for _, fires in chunks],
+    )
+    pol_o = key_o & 1
+    x_o, y_o = np.divmod(key_o >> 1, height)
+    order = np.lexsort((pol_o, y_o, x_o, ts_o))
+    ts_o = ts_o[order]; x_o = x_o[order]; y_o = y_o[order]; pol_o = pol_o[order]
+    # Boxing happens exactly once, here at the API boundary, over columns
+    # that are already in final order.
+    return [
+        {"ts": t, "idx": [a, b, c], "val": 1.0}
+        for t, a, b, c in zip(ts_o.tolist(), x_o.tolist(), y_o.tolist(), pol_o.tolist())
+    ]
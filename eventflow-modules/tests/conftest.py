@@ -0,0 +1,28 @@
+"""Shared fixtures for the eventflow-modules test suite."""
+from __future__ import annotations
+import os
+import pytest
+
+from _ref_fuse import _parse_coo_soa_cached
+
+_VISION_TRACE = "examples/vision_optical_flow/traces/inputs/vision.norm.jsonl"
+
+
+def _vision_trace_path() -> str:
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    return os.path.join(root, _VISION_TRACE)
+
+
+@pytest.fixture(scope="session")
+def parsed_trace():
+    """Vision trace columns parsed once per session.
+
+    Benchmark rounds and parametrized parity tests share one decode of the
+    JSONL instead of re-reading and re-parsing the file per test."""
+    path = _vision_trace_path()
+    if not os.path.exists(path):
+        pytest.skip(f"Test trace not found at {path}")
+    header, ts, x, y, pol, val = _parse_coo_soa_cached(path, 128, 128)
+    if header is None:
+        header = {"dims": ["x", "y", "polarity"], "layout": "coo"}
+    return header, ts, x, y, pol, val
@@ -1,10 +1,8 @@
 from __future__ import annotations
+import functools
 import os
 import time
-import json
-import statistics
 from typing import Callable, Any
-import numpy as np
 import pytest
 
 try:
@@ -12,6 +10,14 @@ try:
 except Exception:
     vis_native = None  # type: ignore
 
+# Shared Python reference (parse + shift/delay/fuse kernels), identical to
+# the one the benchmark suite measures.
+from _ref_fuse import (
+    _parse_coo_soa,
+    _arrays_to_events,
+    _shift_delay_fuse_arrays,
+)
+
 
 def _env_enabled(name: str) -> bool:
     val = os.getenv(name)
@@ -38,39 +44,33 @@ def _get_trace_path() -> str:
 
 
 _SINK = 0
-def measure(fn: Callable[[], Any], reps: int = 3, warmup: int = 1, consume: Callable[[Any], int] | None = None) -> float:
+
+
+def _consume_header_events(out) -> int:
+    """Cheap typed consumer for (header, events) outputs; raises on anything
+    else rather than falling back to stringifying millions of events."""
+    h, ev = out
+    return (len(ev) << 1) | (1 if "layout" in h else 0)
+
+
+def measure(fn: Callable[[], Any], reps: int = 5, warmup: int = 1, consume: Callable[[Any], int] = _consume_header_events) -> float:
     """
-    Measure median wall time of fn() over reps after warmups.
+    Measure best-of-reps wall time of fn() after warmups.
+    The min excludes scheduler preemption noise, which is what a
+    best-achievable-throughput gate should compare.
     Ensures outputs are consumed to avoid dead-code elimination.
     """
     global _SINK
     for _ in range(warmup):
-        out = fn()
-        if consume is None:
-            try:
-                a, b = out  # type: ignore[misc]
-                _SINK ^= int(getattr(a, "get", lambda k, d=None: None)("layout") is not None)
-                _SINK ^= len(b) if hasattr(b, "__len__") else 0
-            except Exception:
-                _SINK ^= hash(str(out)) & 0xFFFFFFFF
-        else:
-            _SINK ^= int(consume(out)) & 0xFFFFFFFF
+        _SINK ^= int(consume(fn())) & 0xFFFFFFFF
     times: list[float] = []
     for _ in range(reps):
         t0 = time.perf_counter()
         out = fn()
         t1 = time.perf_counter()
-        if consume is None:
-            try:
-                a, b = out  # type: ignore[misc]
-                _SINK ^= int(getattr(a, "get", lambda k, d=None: None)("layout") is not None)
-                _SINK ^= len(b) if hasattr(b, "__len__") else 0
-            except Exception:
-                _SINK ^= hash(str(out)) & 0xFFFFFFFF
-        else:
-            _SINK ^= int(consume(out)) & 0xFFFFFFFF
+        _SINK ^= int(consume(out)) & 0xFFFFFFFF
         times.append(t1 - t0)
-    return statistics.median(times)
+    return min(times)
 
 
 def _get_thresh(name: str, default: float) -> float:
@@ -85,87 +85,29 @@ def python_coo_from_jsonl_ref(path: str, width: int, height: int, window_us: int
     Minimal pass-through reference to mirror the example graph behavior used in tests.
     Returns (header: dict, events: list[dict]).
     """
-    header = None
-    events = []
-    with open(path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            ev = json.loads(line)
-            if "header" in ev:
-                header = ev["header"]
-                continue
-            ts = ev.get("ts")
-            idx = ev.get("idx", [])
-            if not isinstance(idx, list) or len(idx) != 3:
-                continue
-            x, y, pol = idx
-            if 0 <= x < width and 0 <= y < height and 0 <= pol <= 1:
-                val = float(ev.get("val", 1.0))
-                events.append({"ts": int(ts), "idx": [int(x), int(y), int(pol)], "val": val})
-    events.sort(key=lambda e: (e["ts"], e["idx"][0], e["idx"][1], e["idx"][2]))
+    header, ts, x, y, pol, val = _parse_coo_soa(path, width, height)
     if header is None:
         header = {"dims": ["x", "y", "polarity"], "layout": "coo"}
-    return header, events
+    return header, _arrays_to_events(ts, x, y, pol, val)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_trace_arrays(path: str, width: int, height: int):
+    """Parse the trace once per (path, width, height) for the whole module.
+
+    measure() re-invokes its callable reps+warmup times; caching the parse
+    keeps repeated file I/O and JSON decoding out of the measured loop so the
+    fuse gate compares the shift/delay/fuse algorithm, not parse throughput.
+    """
+    return _parse_coo_soa(path, width, height)
 
 
 def _python_shift_delay_fuse_ref(path: str, width: int, height: int, window_us: int, delay_us: int, edge_delay_us: int, min_count: int):
     """
     Reference for shift(+/-1 x) + delay + coincidence fuse. Returns (header, events)
     """
-    from collections import deque, defaultdict
-    eff_delay = int(delay_us + edge_delay_us)
-    header = None
-    a_events = []
-    with open(path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            ev = json.loads(line)
-            if "header" in ev:
-                header = ev["header"]
-                continue
-            ts = int(ev["ts"])
-            x, y, pol = ev["idx"]
-            if 0 <= x < width and 0 <= y < height and 0 <= pol <= 1:
-                a_events.append({"ts": ts, "idx": [x, y, pol], "val": float(ev.get("val", 1.0))})
-    a_events.sort(key=lambda e: e["ts"])
-
-    # Build shifted/delayed B streams
-    a_map = defaultdict(list)
-    b_map = defaultdict(list)
-    for e in a_events:
-        ts = e["ts"]; x, y, pol = e["idx"]
-        a_map[(x, y, pol)].append(ts)
-        b_ts = ts + eff_delay
-        if x + 1 < width:
-            b_map[(x + 1, y, pol)].append(b_ts)
-        if x - 1 >= 0:
-            b_map[(x - 1, y, pol)].append(b_ts)
-
-    # Fuse per coordinate with sliding windows
-    out = []
-    keys = set(list(a_map.keys()) + list(b_map.keys()))
-    for key in keys:
-        va = sorted(a_map.get(key, []))
-        vb = sorted(b_map.get(key, []))
-        i = j = 0
-        buf_a, buf_b = deque(), deque()
-        while i < len(va) or j < len(vb):
-            take_a = j >= len(vb) or (i < len(va) and va[i] <= vb[j])
-            if take_a:
-                t = va[i]; i += 1; buf_a.append(t)
-            else:
-                t = vb[j]; j += 1; buf_b.append(t)
-            cutoff = t - window_us
-            while buf_a and buf_a[0] < cutoff: buf_a.popleft()
-            while buf_b and buf_b[0] < cutoff: buf_b.popleft()
-            if buf_a and buf_b and (len(buf_a) + len(buf_b)) >= int(min_count):
-                x, y, pol = key
-                out.append({"ts": t, "idx": [x, y, pol], "val": 1.0})
-    out.sort(key=lambda e: (e["ts"], e["idx"][0], e["idx"][1], e["idx"][2]))
+    header, ts, x, y, pol, _val = _load_trace_arrays(path, width, height)
+    out = _shift_delay_fuse_arrays(ts, x, y, pol, width, height, window_us, delay_us, edge_delay_us, min_count)
     if header is None:
         header = {"dims": ["x", "y", "polarity"], "layout": "coo"}
     return header, out
@@ -188,8 +130,8 @@ def test_gate_optical_flow_pass_speedup():
     def run_python():
         return python_coo_from_jsonl_ref(path, width, height, window_us, delay_us, edge_delay_us, min_count)
 
-    t_n = measure(run_native, reps=3, warmup=1)
-    t_p = measure(run_python, reps=3, warmup=1)
+    t_n = measure(run_native, warmup=1)
+    t_p = measure(run_python, warmup=1)
     speedup = t_p / t_n if t_n > 0 else float("inf")
     thresh = _get_thresh("MOD_PASS_MIN", 1.3)
     assert speedup >= thresh, f"optical_flow_coo_from_jsonl speedup {speedup:.2f}x < {thresh}x (native {t_n:.4f}s vs python {t_p:.4f}s)"
@@ -201,14 +143,17 @@ def test_gate_optical_flow_shift_delay_fuse_speedup():
     width = 128; height = 128
     window_us = 5000; delay_us = 2000; edge_delay_us = 200; min_count = 2
 
+    # Parse once up front; the measured Python callable is the fuse alone
+    _, ts, x, y, pol, _val = _load_trace_arrays(path, width, height)
+
     def run_native():
         return vis_native.optical_flow_shift_delay_fuse_coo(path, width, height, window_us, delay_us, edge_delay_us, min_count)  # type: ignore[attr-defined]
 
     def run_python():
-        return _python_shift_delay_fuse_ref(path, width, height, window_us, delay_us, edge_delay_us, min_count)
+        return _shift_delay_fuse_arrays(ts, x, y, pol, width, height, window_us, delay_us, edge_delay_us, min_count)
 
-    t_n = measure(run_native, reps=3, warmup=1)
-    t_p = measure(run_python, reps=3, warmup=1)
+    t_n = measure(run_native, warmup=1)
+    t_p = measure(run_python, warmup=1, consume=len)
     speedup = t_p / t_n if t_n > 0 else float("inf")
     thresh = _get_thresh("MOD_FUSE_MIN", 1.5)
     assert speedup >= thresh, f"optical_flow_shift_delay_fuse_coo speedup {speedup:.2f}x < {thresh}x (native {t_n:.4f}s vs python {t_p:.4f}s)"
\ No newline at end of file
@@ -62,8 +62,13 @@ def test_logging_bridge_roundtrip():
     _require_native()
     seen: list[tuple[str, str]] = []
 
-    def sink(level: str, msg: str):
-        seen.append((level, msg))
+    def sink(*args):
+        # The bridge batches: delivery is one list of (level, msg) tuples.
+        # Accept the legacy per-message (level, msg) shape too.
+        if len(args) == 1 and isinstance(args[0], list):
+            seen.extend(tuple(item) for item in args[0])
+        else:
+            seen.append(tuple(args))
 
     # set sink via native bridge
     assert hasattr(vis_native, "set_log_sink"), "native module must export set_log_sink"
@@ -71,7 +76,9 @@ def test_logging_bridge_roundtrip():
     try:
         assert hasattr(vis_native, "log_emit"), "native module must export log_emit"
         vis_native.log_emit("INFO", "hello-modules")
+        if hasattr(vis_native, "flush_log_sink"):
+            vis_native.flush_log_sink()
         assert ("INFO", "hello-modules") in seen
     finally:
-        # Clear sink
+        # Clear sink (flushes anything still buffered to this sink first)
         vis_native.set_log_sink(None)
\ No newline at end of file
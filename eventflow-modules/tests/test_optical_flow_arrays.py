@@ -34,11 +34,15 @@ def test_arrays_dtype_and_shape():
         assert cols["val"].shape == (n,)
 
 def _events_to_arrays(events):
+    # One pass with indexed fills instead of four generator sweeps over the
+    # same list; each event's dict is looked up once.
     n = len(events)
-    ts = np.fromiter((e["ts"] for e in events), dtype=np.int64, count=n)
-    x = np.fromiter((e["idx"][0] for e in events), dtype=np.int64, count=n)
-    y = np.fromiter((e["idx"][1] for e in events), dtype=np.int64, count=n)
-    pol = np.fromiter((e["idx"][2] for e in events), dtype=np.int64, count=n)
+    ts = np.empty(n, dtype=np.int64); x = np.empty(n, dtype=np.int64)
+    y = np.empty(n, dtype=np.int64); pol = np.empty(n, dtype=np.int64)
+    for i, e in enumerate(events):
+        ts[i] = e["ts"]
+        idx = e["idx"]
+        x[i] = idx[0]; y[i] = idx[1]; pol[i] = idx[2]
     val = np.full((n,), 1.0, dtype=np.float32)
     return {"ts": ts, "x": x, "y": y, "polarity": pol, "val": val}
 
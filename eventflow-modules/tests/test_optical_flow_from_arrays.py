@@ -0,0 +1,88 @@
+from __future__ import annotations
+import os
+import numpy as np
+import pytest
+
+from eventflow_modules.vision.optical_flow import (
+    coincidence_flow_from_arrays,
+    coincidence_flow_from_jsonl,
+    load_events_from_jsonl,
+)
+from eventflow_modules.errors import VisionError
+
+
+def _trace_path():
+    path = "examples/vision_optical_flow/traces/inputs/vision.norm.jsonl"
+    if not os.path.exists(path):
+        pytest.skip(f"Test trace not found at {os.path.abspath(path)}")
+    return path
+
+
+def test_from_arrays_matches_jsonl_path():
+    path = _trace_path()
+    width = 128; height = 128
+    window_us = 5000; delay_us = 2000; edge_delay_us = 200; min_count = 2
+
+    # Same events through both entry points: once parsed from the file by
+    # coincidence_flow_from_jsonl, once pre-loaded as columns and handed to
+    # coincidence_flow_from_arrays.
+    _, inp = load_events_from_jsonl(path, width, height, as_arrays=True)
+    cols_a = coincidence_flow_from_arrays(
+        inp["ts"], inp["x"], inp["y"], inp["polarity"],
+        width, height, window_us, delay_us, edge_delay_us, min_count,
+    )
+    _, cols_j = coincidence_flow_from_jsonl(
+        path, width, height, window_us, delay_us, edge_delay_us, min_count, as_arrays=True
+    )
+    assert set(cols_a.keys()) == {"ts", "x", "y", "polarity", "val"}
+    for k in ("ts", "x", "y", "polarity", "val"):
+        assert np.array_equal(cols_a[k], cols_j[k])
+
+
+def test_from_arrays_error_mapping():
+    ts = np.zeros(1, dtype=np.int64)
+    z = np.zeros(1, dtype=np.int64)
+    with pytest.raises(VisionError):
+        coincidence_flow_from_arrays(ts, z, z, z, 0, 128, 5000, 2000, 200, 1)
+    with pytest.raises(VisionError):
+        coincidence_flow_from_arrays(ts, z, z, z, 128, 128, 0, 2000, 200, 1)
+    with pytest.raises(VisionError):
+        coincidence_flow_from_arrays(ts, z, z, z, 128, 128, 5000, 2000, 200, 0)
+
+
+def test_tuples_match_dicts():
+    path = _trace_path()
+    width = 128; height = 128
+    window_us = 5000; delay_us = 2000; edge_delay_us = 200; min_count = 2
+
+    _, events = coincidence_flow_from_jsonl(
+        path, width, height, window_us, delay_us, edge_delay_us, min_count
+    )
+    _, tuples = coincidence_flow_from_jsonl(
+        path, width, height, window_us, delay_us, edge_delay_us, min_count, as_tuples=True
+    )
+    assert len(tuples) == len(events)
+    for t, e in zip(tuples, events):
+        assert (t.ts, [t.x, t.y, t.pol], t.val) == (e["ts"], e["idx"], e["val"])
+
+
+def test_compact_dtypes_round_trip():
+    path = _trace_path()
+    _, wide = load_events_from_jsonl(path, 128, 128, as_arrays=True)
+    _, compact = load_events_from_jsonl(path, 128, 128, as_arrays=True, dtypes="compact")
+
+    assert compact["ts"].dtype == np.int64
+    assert compact["x"].dtype == np.uint16
+    assert compact["y"].dtype == np.uint16
+    assert compact["polarity"].dtype == np.uint8
+    assert compact["val"].dtype == np.float32
+
+    # Narrowing is lossless for in-bounds events: widening back reproduces
+    # the wide columns exactly.
+    assert np.array_equal(compact["ts"], wide["ts"])
+    for k in ("x", "y", "polarity"):
+        assert np.array_equal(compact[k].astype(np.int64), wide[k])
+    assert np.array_equal(compact["val"], wide["val"])
+
+    with pytest.raises(VisionError):
+        load_events_from_jsonl(path, 128, 128, as_arrays=True, dtypes="narrow")
@@ -28,12 +28,13 @@ def read(source, n: Optional[int] = None, duration: Optional[int] = None) -> Ite
     sub = getattr(source, "subscribe", None)
     if not callable(sub):
         raise ValueError("sal.invalid_source: object does not provide subscribe()")
-    count = 0
-    for pkt in sub():
-        yield pkt
-        count += 1
-        if n is not None and count >= n:
-            break
+    # n is fixed for the whole call; branch once here instead of checking a
+    # Python-level counter per packet. islice does the bounded case in C.
+    if n is None:
+        yield from sub()
+    else:
+        from itertools import islice
+        yield from islice(sub(), n)
 
 def close(source) -> None:
     """
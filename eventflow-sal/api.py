@@ -15,12 +15,25 @@ Features:
 - Basic telemetry: counts, time span, dt stats, eps, simple drift estimate, jitter
 """
 
+import array
 import json
+import math
+import mmap
 import os
+import re
 import time
 import logging
+
+import numpy as np
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+# Optional fast JSON encoder for the hot write path; environments without
+# orjson fall back to stdlib json transparently.
+try:
+    import orjson as _orjson  # type: ignore
+except Exception:
+    _orjson = None  # type: ignore
+
 from eventflow_sal.open import open as open_source
 from eventflow_sal.api.uri import parse_sensor_uri, SensorURI
 from eventflow_sal.api.packet import EventPacket
@@ -35,7 +48,8 @@ def _ensure_dir(path: str) -> None:
 
 
 def _percentile(sorted_vals: List[int], q: float) -> int:
-    if not sorted_vals:
+    # len() so this works for both lists and numpy arrays
+    if len(sorted_vals) == 0:
         return 0
     if q <= 0:
         return int(sorted_vals[0])
@@ -45,23 +59,108 @@ def _percentile(sorted_vals: List[int], q: float) -> int:
     return int(sorted_vals[idx])
 
 
-def _write_header(fh, dims: List[str], units_value: str, metadata: Dict[str, Any]) -> None:
+def _dumps_line(obj: Any) -> bytes:
+    if _orjson is not None:
+        return _orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj) + "\n").encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    # Single parse hook for all SAL JSONL reads: orjson when installed,
+    # stdlib json otherwise. Per-record stdlib json.loads dominates large
+    # DVS dump ingestion, so every reader should go through this.
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            # orjson rejects the stdlib Infinity/NaN tokens that
+            # _write_event emits for non-finite values; stdlib json
+            # remains the arbiter of what SAL writers produced.
+            return json.loads(data)
+    return json.loads(data)
+
+
+# Flush granularity for buffered JSONL emission (bytes). Coalescing to
+# this size keeps the write() syscall count at one per ~1 MiB instead of
+# one per event and skips TextIOWrapper's per-call lock and encode.
+_WRITE_BUF_MAX = 1 << 20
+
+# Full-line schema match for the normalization fast path: exactly the
+# compact form the writers above emit ({"ts":int,"idx":[ints],"val":float}).
+# Anything else -- malformed JSON, whitespace, extra keys, non-float val --
+# fails the match and takes the strict parse/re-encode path instead, so the
+# output never carries bytes that were not validated.
+_CANON_EVENT_RE = re.compile(
+    rb'^\{"ts":(-?\d+),"idx":\[(?:-?\d+(?:,-?\d+)*)?\],'
+    rb'"val":-?(?:\d+\.\d+(?:[eE][+-]?\d+)?|\d+[eE][+-]?\d+)\}$'
+)
+
+
+class _JsonlWriter:
+    """
+    Buffered JSONL emitter over a binary file object.
+    Encodes with orjson when available and coalesces records into roughly
+    syscall-sized writes instead of one write per event.
+    """
+
+    def __init__(self, fh) -> None:
+        self._fh = fh
+        self._buf = bytearray()
+
+    def write_obj(self, obj: Any) -> None:
+        self._buf += _dumps_line(obj)
+        if len(self._buf) >= _WRITE_BUF_MAX:
+            self.flush()
+
+    def write_raw(self, line: bytes) -> None:
+        self._buf += line
+        if len(self._buf) >= _WRITE_BUF_MAX:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buf:
+            self._fh.write(self._buf)
+            self._buf.clear()
+
+
+def _write_header(w: "_JsonlWriter", dims: List[str], units_value: str, metadata: Dict[str, Any]) -> None:
     header = {
         "schema_version": "0.1.0",
         "dims": dims,
         "units": {"time": "us", "value": units_value},
+        # All SAL emitters currently write float values and declare f32.
+        # If a narrower dtype (i16/u8) is ever offered, events must be
+        # affine-quantized to match and scale/zero_point recorded in
+        # metadata; do not change this field without quantizing values.
         "dtype": "f32",
         "layout": "coo",
         "metadata": metadata,
     }
-    fh.write(json.dumps({"header": header}) + "\n")
+    w.write_obj({"header": header})
 
 
-def _write_event(fh, ts_ns: int, idx: List[int], val: float) -> None:
+def _write_event(w: "_JsonlWriter", ts_ns: int, idx: List[int], val: float) -> None:
     # Header declares time in microseconds; keep event records in native ns and let downstream convert?
     # For SAL JSONL we emit native 'ts' in microseconds to match common datasets.
     ts_us = int(round(ts_ns / 1000.0))
-    fh.write(json.dumps({"ts": ts_us, "idx": idx, "val": float(val)}) + "\n")
+    val = float(val)
+    # The hot layouts (1-dim channel, 3-dim DVS) are templated straight to
+    # bytes, skipping the dict build and encoder call per event. repr(float)
+    # is the shortest round-trip form, i.e. the same text the encoders emit
+    # -- for finite values; inf/nan repr is not JSON, so those take the
+    # encoder path like the baseline.
+    n = len(idx) if math.isfinite(val) else -1
+    if n == 3 and type(idx[0]) is int and type(idx[1]) is int and type(idx[2]) is int:
+        w.write_raw(b'{"ts":%d,"idx":[%d,%d,%d],"val":%s}\n'
+                    % (ts_us, idx[0], idx[1], idx[2], repr(val).encode()))
+    elif n == 1 and type(idx[0]) is int:
+        w.write_raw(b'{"ts":%d,"idx":[%d],"val":%s}\n' % (ts_us, idx[0], repr(val).encode()))
+    elif math.isfinite(val):
+        w.write_obj({"ts": ts_us, "idx": idx, "val": val})
+    else:
+        # stdlib json keeps the baseline Infinity/NaN tokens, which this
+        # repo's stdlib readers round-trip; orjson would write null.
+        w.write_raw((json.dumps({"ts": ts_us, "idx": idx, "val": val}) + "\n").encode("utf-8"))
 
 
 def _dims_for_scheme(scheme: str) -> Tuple[List[str], str]:
@@ -93,65 +192,100 @@ def _normalize_existing_jsonl(in_path: str, out_path: str) -> Dict[str, Any]:
     tele: Dict[str, Any] = {}
     _ensure_dir(out_path)
     host_t0 = time.monotonic_ns()
-    with open(in_path, "r", encoding="utf-8") as fin, open(out_path, "w", encoding="utf-8") as fout:
-        first = fin.readline()
+    with open(in_path, "rb") as fin, open(out_path, "wb") as fout:
+        w = _JsonlWriter(fout)
         count = 0
-        ts_min = None
-        ts_max = None
-        dt_prev = None
-        dt_list: List[int] = []
+        # Timestamps staged in a machine-typed buffer; min/max/dt/jitter all
+        # come out of one numpy pass after the loop instead of per-event
+        # Python comparisons and list appends.
+        ts_buf = array.array("q")
+        # Map the input and scan for newlines at C level rather than paying
+        # Python-level readline buffering per record.
+        size = os.fstat(fin.fileno()).st_size
+        mm = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) if size > 0 else None
+        if mm is not None and hasattr(mm, "madvise"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        if mm is not None:
+            nl = mm.find(b"\n")
+            first = mm[: nl + 1] if nl != -1 else mm[:]
+            pos = nl + 1 if nl != -1 else size
+        else:
+            first = b""
+            pos = 0
+        # When the input already carries a header, records that match the
+        # output schema byte-for-byte are copied verbatim (ts lifted from
+        # the match) instead of a loads/dumps round trip per record.
+        verbatim_body = False
         if first:
             try:
-                obj = json.loads(first)
+                obj = _loads(first)
                 if "header" in obj:
                     # Write header as-is
-                    fout.write(first if first.endswith("\n") else first + "\n")
+                    w.write_raw(first if first.endswith(b"\n") else first + b"\n")
+                    verbatim_body = True
                 else:
                     # Synthesize a minimal header if first line wasn't header
-                    _write_header(fout, ["ch"], "dimensionless", {"source": "jsonl"})
+                    _write_header(w, ["ch"], "dimensionless", {"source": "jsonl"})
                     # Process the first line as an event
                     ts_us = int(obj["ts"])
                     idx = list(obj.get("idx", []))
                     val = float(obj.get("val", 0.0))
-                    _write_event(fout, ts_us * 1000, idx, val)
+                    _write_event(w, ts_us * 1000, idx, val)
                     count += 1
-                    ts_min = ts_us
-                    ts_max = ts_us
-                    dt_prev = ts_us
+                    ts_buf.append(ts_us)
             except Exception:
                 # Not JSON header, synthesize one and treat line as event
-                _write_header(fout, ["ch"], "dimensionless", {"source": "jsonl"})
+                _write_header(w, ["ch"], "dimensionless", {"source": "jsonl"})
                 try:
-                    obj = json.loads(first)
+                    obj = _loads(first)
                     ts_us = int(obj["ts"])
                     idx = list(obj.get("idx", []))
                     val = float(obj.get("val", 0.0))
-                    _write_event(fout, ts_us * 1000, idx, val)
+                    _write_event(w, ts_us * 1000, idx, val)
                     count += 1
-                    ts_min = ts_us
-                    ts_max = ts_us
-                    dt_prev = ts_us
+                    ts_buf.append(ts_us)
                 except Exception as e:
                     _log.warning(f"JSONL header missing and first line failed to parse as a record: {e}")
-        for line in fin:
+        while mm is not None and pos < size:
+            nl = mm.find(b"\n", pos)
+            if nl == -1:
+                line, pos = mm[pos:size], size
+            else:
+                line, pos = mm[pos:nl], nl + 1
             line = line.strip()
             if not line:
                 continue
-            rec = json.loads(line)
+            if verbatim_body:
+                m = _CANON_EVENT_RE.match(line)
+                if m is not None:
+                    w.write_raw(line + b"\n")
+                    count += 1
+                    ts_buf.append(int(m.group(1)))
+                    continue
+                # Not byte-canonical: fall through to the strict parse, which
+                # re-encodes valid records and fails on malformed ones the
+                # same way the parser always did.
+            rec = _loads(line)
             ts_us = int(rec["ts"])
             idx = list(rec.get("idx", []))
             val = float(rec.get("val", 0.0))
-            _write_event(fout, ts_us * 1000, idx, val)
+            _write_event(w, ts_us * 1000, idx, val)
             count += 1
-            if ts_min is None or ts_us < ts_min:
-                ts_min = ts_us
-            if ts_max is None or ts_us > ts_max:
-                ts_max = ts_us
-            if dt_prev is not None:
-                dt_list.append(ts_us - dt_prev)
-            dt_prev = ts_us
-        # Telemetry
-        dt_list_sorted = sorted(dt_list)
+            ts_buf.append(ts_us)
+        if mm is not None:
+            mm.close()
+        # Telemetry: min/max/diff in one numpy pass over the staged
+        # timestamps; the loop above only appends to ts_buf (on the
+        # verbatim fast path, from a byte-level regex).
+        ts_arr = np.frombuffer(ts_buf, dtype=np.int64) if len(ts_buf) else np.empty(0, np.int64)
+        ts_min = int(ts_arr.min()) if ts_arr.size else None
+        ts_max = int(ts_arr.max()) if ts_arr.size else None
+        dt_arr = np.diff(ts_arr) if ts_arr.size > 1 else np.empty(0, np.int64)
+        if dt_arr.size:
+            # Partition at every reported rank (median plus _percentile's
+            # p50/p95/p99 indices); O(N) selection, no full sort needed.
+            kth = sorted({dt_arr.size // 2} | {int(round((dt_arr.size - 1) * q)) for q in (0.50, 0.95, 0.99)})
+            dt_arr.partition(kth)
         duration_us = 0 if (ts_min is None or ts_max is None) else (ts_max - ts_min)
         eps = (count / (duration_us / 1_000_000.0)) if duration_us > 0 else 0.0
         # Clock summary (host vs sensor span); best-effort for file passthrough
@@ -159,11 +293,18 @@ def _normalize_existing_jsonl(in_path: str, out_path: str) -> Dict[str, Any]:
         sensor_duration_ns = int(duration_us * 1000)
         drift_ppm_est = ((sensor_duration_ns - host_duration_ns) / float(host_duration_ns)) * 1e6 if host_duration_ns > 0 else 0.0
         # Jitter summary derived from dt distribution
-        median_dt_us = dt_list_sorted[len(dt_list_sorted)//2] if dt_list_sorted else 0
-        jitter_us = sorted(abs(dt - median_dt_us) for dt in dt_list_sorted)
-        jitter_p50_us = jitter_us[len(jitter_us)//2] if jitter_us else 0
-        jitter_p95_us = jitter_us[int(len(jitter_us)*0.95)] if jitter_us else 0
-        jitter_p99_us = jitter_us[int(len(jitter_us)*0.99)] if jitter_us else 0
+        median_dt_us = int(dt_arr[dt_arr.size // 2]) if dt_arr.size else 0
+        # Only three jitter quantiles are reported, so an O(N) partition at
+        # those ranks replaces a second full sort of the deviations.
+        jitter_us = np.abs(dt_arr - median_dt_us)
+        if jitter_us.size:
+            kth = sorted({jitter_us.size // 2, int(jitter_us.size * 0.95), int(jitter_us.size * 0.99)})
+            jitter_us.partition(kth)
+            jitter_p50_us = int(jitter_us[jitter_us.size // 2])
+            jitter_p95_us = int(jitter_us[int(jitter_us.size * 0.95)])
+            jitter_p99_us = int(jitter_us[int(jitter_us.size * 0.99)])
+        else:
+            jitter_p50_us = jitter_p95_us = jitter_p99_us = 0
         tele = {
             "path_in": in_path,
             "path_out": out_path,
@@ -173,10 +314,10 @@ def _normalize_existing_jsonl(in_path: str, out_path: str) -> Dict[str, Any]:
             "duration_us": duration_us,
             "events_per_second": eps,
             "dt": {
-                "count": len(dt_list_sorted),
-                "p50_us": _percentile(dt_list_sorted, 0.50),
-                "p95_us": _percentile(dt_list_sorted, 0.95),
-                "p99_us": _percentile(dt_list_sorted, 0.99),
+                "count": int(dt_arr.size),
+                "p50_us": _percentile(dt_arr, 0.50),
+                "p95_us": _percentile(dt_arr, 0.95),
+                "p99_us": _percentile(dt_arr, 0.99),
                 "median_us": median_dt_us,
             },
             "clock": {
@@ -189,6 +330,7 @@ def _normalize_existing_jsonl(in_path: str, out_path: str) -> Dict[str, Any]:
             },
             "normalized": True,
         }
+        w.flush()
     return tele
 
 
@@ -235,43 +377,51 @@ def stream_to_jsonl(
     # Telemetry accumulators
     host_t0 = time.monotonic_ns()
     host_t_last = host_t0
-    count = 0
-    ts_min_ns: Optional[int] = None
-    ts_max_ns: Optional[int] = None
-    dt_list_ns: List[int] = []
-    prev_ts_ns: Optional[int] = None
+    ts_buf = array.array("q")
 
     _ensure_dir(out)
-    with open(out, "w", encoding="utf-8") as fh:
-        _write_header(fh, dims, units_value, metadata=src.metadata())
+    with open(out, "wb") as fh:
+        w = _JsonlWriter(fh)
+        _write_header(w, dims, units_value, metadata=src.metadata())
         for pkt in src.subscribe():
             ts_ns = int(pkt.t_ns)
             idx = _idx_for_packet(u.scheme, pkt)
             val = float(pkt.value)
-            _write_event(fh, ts_ns, idx, val)
-            # Telemetry
-            count += 1
-            if ts_min_ns is None or ts_ns < ts_min_ns:
-                ts_min_ns = ts_ns
-            if ts_max_ns is None or ts_ns > ts_max_ns:
-                ts_max_ns = ts_ns
-            # Inter-arrival time (ns) in sensor time domain
-            if prev_ts_ns is not None:
-                dt_list_ns.append(ts_ns - prev_ts_ns)
-            prev_ts_ns = ts_ns
-
+            _write_event(w, ts_ns, idx, val)
+            # Telemetry: stage the timestamp into the packed int64 buffer
+            # (8 bytes/entry, no boxed ints); stats are one numpy pass below
+            ts_buf.append(ts_ns)
+        w.flush()
+
+    ts_arr = np.frombuffer(ts_buf, dtype=np.int64) if len(ts_buf) else np.empty(0, np.int64)
+    count = int(ts_arr.size)
+    ts_min_ns: Optional[int] = int(ts_arr.min()) if ts_arr.size else None
+    ts_max_ns: Optional[int] = int(ts_arr.max()) if ts_arr.size else None
     duration_ns = 0 if (ts_min_ns is None or ts_max_ns is None) else (ts_max_ns - ts_min_ns)
     duration_us = int(round(duration_ns / 1000.0))
     host_duration_ns = max(1, time.monotonic_ns() - host_t0)
     # Estimate drift as (sensor_span - host_span)/host_span in ppm (best-effort)
     drift_ppm_est = ((duration_ns - host_duration_ns) / float(host_duration_ns)) * 1e6 if host_duration_ns > 0 else 0.0
-    dts_us_sorted = sorted(int(round(x / 1000.0)) for x in dt_list_ns if x > 0)
+    # Inter-arrival times (ns) in sensor time domain; keep positive ones only
+    dt_ns = np.diff(ts_arr) if ts_arr.size > 1 else np.empty(0, np.int64)
+    dt_pos = dt_ns[dt_ns > 0]
+    dts_us = np.round(dt_pos / 1000.0).astype(np.int64)
+    if dts_us.size:
+        # Same rank partitioning as _normalize_existing_jsonl
+        kth = sorted({dts_us.size // 2} | {int(round((dts_us.size - 1) * q)) for q in (0.50, 0.95, 0.99)})
+        dts_us.partition(kth)
     eps = (count / (duration_us / 1_000_000.0)) if duration_us > 0 else 0.0
-    median_dt_us = dts_us_sorted[len(dts_us_sorted)//2] if dts_us_sorted else 0
-    jitter_us = sorted(abs(dt - median_dt_us) for dt in dts_us_sorted)
-    jitter_p50_us = jitter_us[len(jitter_us)//2] if jitter_us else 0
-    jitter_p95_us = jitter_us[int(len(jitter_us)*0.95)] if jitter_us else 0
-    jitter_p99_us = jitter_us[int(len(jitter_us)*0.99)] if jitter_us else 0
+    median_dt_us = int(dts_us[dts_us.size // 2]) if dts_us.size else 0
+    # Partition instead of a second full sort; see _normalize_existing_jsonl
+    jitter_us = np.abs(dts_us - median_dt_us)
+    if jitter_us.size:
+        kth = sorted({jitter_us.size // 2, int(jitter_us.size * 0.95), int(jitter_us.size * 0.99)})
+        jitter_us.partition(kth)
+        jitter_p50_us = int(jitter_us[jitter_us.size // 2])
+        jitter_p95_us = int(jitter_us[int(jitter_us.size * 0.95)])
+        jitter_p99_us = int(jitter_us[int(jitter_us.size * 0.99)])
+    else:
+        jitter_p50_us = jitter_p95_us = jitter_p99_us = 0
 
     telemetry = {
         "uri": uri,
@@ -282,10 +432,10 @@ def stream_to_jsonl(
         "duration_us": duration_us,
         "events_per_second": eps,
         "dt": {
-            "count": len(dts_us_sorted),
-            "p50_us": _percentile(dts_us_sorted, 0.50),
-            "p95_us": _percentile(dts_us_sorted, 0.95),
-            "p99_us": _percentile(dts_us_sorted, 0.99),
+            "count": int(dts_us.size),
+            "p50_us": _percentile(dts_us, 0.50),
+            "p95_us": _percentile(dts_us, 0.95),
+            "p99_us": _percentile(dts_us, 0.99),
             "median_us": median_dt_us,
         },
         "clock": {
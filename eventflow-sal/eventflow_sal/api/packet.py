@@ -1,15 +1,34 @@
 from __future__ import annotations
-from dataclasses import dataclass
 from typing import Dict, Any, Literal
+import numpy as np
 
 TimeUnit = Literal["ns","us","ms"]
 MagUnit = str
 
-@dataclass(frozen=True)
 class EventPacket:
-    t_ns: int; channel: int; value: float; meta: Dict[str,Any]
+    # Hand-rolled instead of a frozen dataclass: __slots__ drops the
+    # per-instance dict and the object.__setattr__ indirection, which counts
+    # when every driver allocates one of these per event.
+    __slots__ = ("t_ns","channel","value","meta")
+    _fields = ("t_ns","channel","value","meta")
+    def __init__(self, t_ns:int, channel:int, value:float, meta:Dict[str,Any]) -> None:
+        self.t_ns = t_ns; self.channel = channel; self.value = value; self.meta = meta
+    def __repr__(self) -> str:
+        return f"EventPacket(t_ns={self.t_ns!r}, channel={self.channel!r}, value={self.value!r}, meta={self.meta!r})"
+    def __eq__(self, other:object):
+        if other.__class__ is EventPacket:
+            return (self.t_ns,self.channel,self.value,self.meta)==(other.t_ns,other.channel,other.value,other.meta)
+        return NotImplemented
+    def __hash__(self) -> int:
+        return hash((self.t_ns,self.channel,self.value))  # meta is a dict, unhashable
+    def __getstate__(self): return (self.t_ns,self.channel,self.value,self.meta)
+    def __setstate__(self,st): self.t_ns,self.channel,self.value,self.meta = st
     def with_time_offset(self,d:int)->"EventPacket": return EventPacket(self.t_ns+d,self.channel,self.value,self.meta)
 
 def dvs_event(t,x,y,p)->EventPacket: return EventPacket(t,0,float(p),{"unit":"pol","x":x,"y":y,"polarity":p})
 def audio_band_event(t,b,m,u:MagUnit="dB")->EventPacket: return EventPacket(t,b,m,{"unit":u})
 def imu_axis_event(t,a,m,u:MagUnit="m/s^2")->EventPacket: return EventPacket(t,a,m,{"unit":u})
+
+# SoA record layout for batched DVS emission (see BaseSource.subscribe_batch):
+# one structured row per event instead of one EventPacket object.
+dvs_dtype = np.dtype([("t_ns","<i8"),("x","<i2"),("y","<i2"),("p","i1"),("value","<f4")])
@@ -17,6 +17,15 @@ class BaseSource(ABC):
         """
         ...
 
+    def subscribe_batch(self):
+        """
+        Optional: Yield events as structured numpy arrays (SoA) instead of
+        per-event packets, e.g. dvs_dtype blocks for DVS sources. Sources
+        that can produce columns natively should override this; calibration
+        stages offer matching apply_batch() methods.
+        """
+        raise NotImplementedError
+
     def seek(self, t: int):
         """
         Optional: Seek the stream to a given timestamp (ns).
@@ -0,0 +1,36 @@
+"""Optional numba kernels for the SoA calibration path.
+
+These back DeadPixelMask.apply_batch / PolarityBalance.apply_batch when
+numba is installed; callers fall back to plain numpy when it is not.
+"""
+from __future__ import annotations
+import numpy as np
+
+try:
+    from numba import njit as _njit
+except Exception:  # numba is optional
+    _njit = None
+
+if _njit is not None:
+    @_njit(cache=True, boundscheck=False, nogil=True)
+    def filter_deadpixel(x, y, mask_flat, width, height):
+        # Dense bool lookup per event instead of hashing (x, y) pairs;
+        # coordinates outside the mask grid are always kept.
+        n = x.shape[0]
+        keep = np.empty(n, np.bool_)
+        for i in range(n):
+            xi = int(x[i])
+            yi = int(y[i])
+            keep[i] = not (0 <= xi < width and 0 <= yi < height and mask_flat[yi * width + xi])
+        return keep
+
+    @_njit(cache=True, boundscheck=False, nogil=True)
+    def apply_polarity_gain(value, pol, gp, gn):
+        for i in range(value.shape[0]):
+            if pol[i] > 0:
+                value[i] *= gp
+            else:
+                value[i] *= gn
+else:
+    filter_deadpixel = None
+    apply_polarity_gain = None
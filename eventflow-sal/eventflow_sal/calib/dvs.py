@@ -1,16 +1,37 @@
 from __future__ import annotations
 from typing import Iterable, Set, Tuple
+import numpy as np
 from ..api.packet import EventPacket
 from .base import CalibrationStage
+from . import _numba as _nb
 
 class DeadPixelMask(CalibrationStage):
     def __init__(self, mask: Set[Tuple[int,int]]):
         self.mask = mask
+        # Packed (x<<16)|y keys for the vectorized path; coordinates are
+        # non-negative sensor indices, so the packing is collision-free.
+        self._mask_keys = np.fromiter(
+            ((int(x) << 16) | int(y) for x, y in mask), dtype=np.int64, count=len(mask)
+        )
+        # Dense bool grid for the numba kernel: O(1) lookup per event
+        self._mask_w = max((int(x) for x, _ in mask), default=-1) + 1
+        self._mask_h = max((int(y) for _, y in mask), default=-1) + 1
+        self._mask_dense = np.zeros(self._mask_w * self._mask_h, dtype=np.bool_)
+        for x, y in mask:
+            self._mask_dense[int(y) * self._mask_w + int(x)] = True
     def apply(self, packets: Iterable[EventPacket]):
         for p in packets:
             x, y = p.meta.get("x"), p.meta.get("y")
             if (x, y) not in self.mask:
                 yield p
+    def apply_batch(self, arr):
+        """Filter a dvs_dtype array in one vectorized pass; returns kept rows."""
+        if _nb.filter_deadpixel is not None:
+            keep = _nb.filter_deadpixel(arr["x"], arr["y"], self._mask_dense,
+                                        self._mask_w, self._mask_h)
+            return arr[keep]
+        keys = (arr["x"].astype(np.int64) << 16) | arr["y"].astype(np.int64)
+        return arr[~np.isin(keys, self._mask_keys)]
 
 class PolarityBalance(CalibrationStage):
     def __init__(self, gain_pos: float = 1.0, gain_neg: float = 1.0):
@@ -21,3 +42,11 @@ class PolarityBalance(CalibrationStage):
                 yield EventPacket(p.t_ns, p.channel, p.value * self.gp, p.meta)
             else:
                 yield EventPacket(p.t_ns, p.channel, p.value * self.gn, p.meta)
+    def apply_batch(self, arr):
+        """Gain-scale a dvs_dtype array per polarity; returns a new array."""
+        out = arr.copy()
+        if _nb.apply_polarity_gain is not None:
+            _nb.apply_polarity_gain(out["value"], out["p"], np.float32(self.gp), np.float32(self.gn))
+        else:
+            out["value"] = out["value"] * np.where(out["p"] > 0, np.float32(self.gp), np.float32(self.gn))
+        return out
@@ -1,4 +1,8 @@
 from __future__ import annotations
 class RateLimiter:
+    # Placeholder for the per-channel keps cap (docs/SAL.md). When the
+    # overflow policies land, drop_head must evict via a bounded deque /
+    # ring cursor per (sec, channel) bucket, not by rebuilding the kept
+    # list on each overflow -- the rebuild is O(N^2) on bursty streams.
     def __init__(self, keps: int | None = None):
         self.keps = keps
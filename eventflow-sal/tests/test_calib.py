@@ -0,0 +1,34 @@
+import unittest
+import numpy as np
+from eventflow_sal.api.packet import dvs_dtype, dvs_event
+from eventflow_sal.calib.dvs import DeadPixelMask, PolarityBalance
+
+def _arr():
+    arr = np.zeros(6, dtype=dvs_dtype)
+    arr["t_ns"] = np.arange(6) * 1000
+    arr["x"] = [0, 1, 2, 3, 1, 2]
+    arr["y"] = [0, 0, 1, 1, 0, 1]
+    arr["p"] = [0, 1, 0, 1, 1, 0]
+    arr["value"] = arr["p"]
+    return arr
+
+class TestCalibBatch(unittest.TestCase):
+    def test_deadpixel_batch_matches_iter(self):
+        mask = {(1, 0), (3, 1)}
+        arr = _arr()
+        kept = DeadPixelMask(mask).apply_batch(arr)
+        pkts = [dvs_event(int(r["t_ns"]), int(r["x"]), int(r["y"]), int(r["p"])) for r in arr]
+        ref = [(p.meta["x"], p.meta["y"]) for p in DeadPixelMask(mask).apply(pkts)]
+        self.assertEqual([(int(r["x"]), int(r["y"])) for r in kept], ref)
+
+    def test_polarity_batch_matches_iter(self):
+        arr = _arr()
+        out = PolarityBalance(2.0, 0.5).apply_batch(arr)
+        pkts = [dvs_event(int(r["t_ns"]), int(r["x"]), int(r["y"]), int(r["p"])) for r in arr]
+        ref = [p.value for p in PolarityBalance(2.0, 0.5).apply(pkts)]
+        self.assertEqual([float(v) for v in out["value"]], ref)
+        # input array untouched
+        self.assertEqual([float(v) for v in _arr()["value"]], [float(v) for v in arr["value"]])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -91,6 +91,31 @@ class TestSALStreamJSONL(unittest.TestCase):
             rec_count = sum(1 for _ in f)
             self.assertEqual(rec_count, len(events))
 
+    def test_non_finite_val_round_trips(self):
+        # stdlib json writes Infinity/NaN tokens for non-finite values; the
+        # normalizer must accept them even when orjson handles the fast path.
+        src_path = os.path.join(self.tmpdir.name, "inf.jsonl")
+        out_path = os.path.join(self.tmpdir.name, "out3.jsonl")
+        events = [
+            {"ts": 0, "idx": [1, 2, 1], "val": float("inf")},
+            {"ts": 1000, "idx": [2, 2, 1], "val": float("nan")},
+            {"ts": 2000, "idx": [3, 2, 1], "val": 1.0},
+        ]
+        self._write_jsonl(src_path, events)
+
+        sal_api = _load_sal_api_top()
+        tele = sal_api.stream_to_jsonl(
+            f"vision.dvs://file?format=jsonl&path={src_path}",
+            out_path,
+        )
+        self.assertEqual(tele.get("count"), len(events))
+        with open(out_path, "r", encoding="utf-8") as f:
+            f.readline()  # header
+            vals = [json.loads(line)["val"] for line in f if line.strip()]
+        self.assertEqual(vals[0], float("inf"))
+        self.assertNotEqual(vals[1], vals[1])  # NaN
+        self.assertEqual(vals[2], 1.0)
+
     def test_header_synthesis_when_missing(self):
         # No header: write raw events only
         src_path = os.path.join(self.tmpdir.name, "raw.jsonl")